@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.core.cache import cache
 from .models import (
     GPU, CPU, RAM, Motherboard, Case, StorageDevice, 
     PSU, Monitor, Mouse, Keyboard, Headset, Speakers, 
@@ -14,9 +15,25 @@ from django.contrib.contenttypes.admin import GenericTabularInline
 
 @admin.register(ProductImage)
 class ProductImageAdmin(admin.ModelAdmin):
-    list_display = ['content_object', 'image', 'is_primary', 'uploaded_at']
+    list_display = ['product', 'image', 'is_primary', 'uploaded_at']
     list_filter = ['is_primary', 'uploaded_at']
     search_fields = ['alt_text']
+    list_select_related = ['content_type']
+    show_full_result_count = False
+    actions = ['mark_primary']
+
+    def get_queryset(self, request):
+        # content_object is rendered on every changelist row
+        return super().get_queryset(request).with_targets()
+
+    @admin.display(description='Product', ordering='content_type')
+    def product(self, obj):
+        return obj.content_object
+
+    @admin.action(description='Mark selected images as primary')
+    def mark_primary(self, request, queryset):
+        updated = ProductImage.set_primary_bulk(queryset.only('pk', 'content_type_id', 'object_id'))
+        self.message_user(request, f"Updated the primary image of {updated} product(s).")
 
 class ProductImageInline(GenericTabularInline):
     model = ProductImage
@@ -24,114 +41,83 @@ class ProductImageInline(GenericTabularInline):
     fields = ['image', 'alt_text', 'is_primary']
     max_num = 10
 
-# Common base list_display and list_filter for all models
-BASE_LIST_DISPLAY = ['name', 'brand', 'sku', 'price', 'condition', 'top_pick']
-BASE_LIST_FILTER = ['brand', 'condition', 'warranty', 'top_pick']
-BASE_SEARCH_FIELDS = ['name', 'brand', 'sku']
-
-@admin.register(GPU)
-class GPUAdmin(admin.ModelAdmin):
-    form = GPUForm
-    list_display = BASE_LIST_DISPLAY + ['model', 'vram']  # sku already in BASE_LIST_DISPLAY
-    list_filter = BASE_LIST_FILTER + ['vram']
-    search_fields = BASE_SEARCH_FIELDS + ['description']
-    inlines = [ProductImageInline]
-
-@admin.register(CPU)
-class CPUAdmin(admin.ModelAdmin):
-    form = CPUForm
-    list_display = BASE_LIST_DISPLAY + ['model', 'cores']  # sku already in BASE_LIST_DISPLAY
-    list_filter = BASE_LIST_FILTER + ['cores']
-    search_fields = BASE_SEARCH_FIELDS + ['description']
-    inlines = [ProductImageInline]
-
-@admin.register(RAM)
-class RAMAdmin(admin.ModelAdmin):
-    form = RAMForm
-    list_display = BASE_LIST_DISPLAY + ['model_name', 'capacity']  # sku already in BASE_LIST_DISPLAY
-    list_filter = BASE_LIST_FILTER + ['capacity']
-    search_fields = BASE_SEARCH_FIELDS + ['description']
-    inlines = [ProductImageInline]
-
-@admin.register(Motherboard)
-class MotherboardAdmin(admin.ModelAdmin):
-    form = MotherboardForm
-    list_display = ['brand', 'model', 'socket', 'condition', 'warranty', 'top_pick', 'price', 'sku']
-    list_filter = ['brand', 'socket', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model', 'sku', 'description']
-    inlines = [ProductImageInline]
-
-@admin.register(Case)
-class CaseAdmin(admin.ModelAdmin):
-    form = CaseForm
-    list_display = ['brand', 'model', 'case_type', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'case_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model', 'sku', 'description']
-    inlines = [ProductImageInline]
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('content_type')
 
-@admin.register(StorageDevice)
-class StorageDeviceAdmin(admin.ModelAdmin):
-    form = StorageDeviceForm
-    list_display = ['brand', 'model_name', 'storage_type', 'capacity', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'storage_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
-
-@admin.register(PSU)
-class PSUAdmin(admin.ModelAdmin):
-    form = PSUForm
-    list_display = ['brand', 'model_name', 'wattage', 'efficiency_rating', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'wattage', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
-
-@admin.register(Monitor)
-class MonitorAdmin(admin.ModelAdmin):
-    form = MonitorForm
-    list_display = ['brand', 'model_name', 'screen_size', 'resolution', 'condition', 'warranty', 'top_pick', 'price', 'sku']
-    list_filter = ['brand', 'panel_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
-
-@admin.register(Mouse)
-class MouseAdmin(admin.ModelAdmin):
-    form = MouseForm
-    list_display = ['brand', 'model_name', 'connection_type', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'connection_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
-
-@admin.register(Keyboard)
-class KeyboardAdmin(admin.ModelAdmin):
-    form = KeyboardForm
-    list_display = ['brand', 'model_name', 'keyboard_type', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'keyboard_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
+# Common base list_display and list_filter for all models
+BASE_LIST_DISPLAY = ('name', 'brand', 'sku', 'price', 'condition', 'top_pick')
+BASE_LIST_FILTER = ('brand', 'condition', 'warranty', 'top_pick')
+BASE_SEARCH_FIELDS = ('name', 'brand', 'sku')
 
-@admin.register(Headset)
-class HeadsetAdmin(admin.ModelAdmin):
-    form = HeadsetForm
-    list_display = ['brand', 'model_name', 'connection_type', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'connection_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
+def make_admin(form_cls, list_display, list_filter, search_fields):
+    """Build a ModelAdmin for a product model that needs no custom layout"""
+    return type(f'{form_cls._meta.model.__name__}Admin', (admin.ModelAdmin,), {
+        'form': form_cls,
+        'list_display': list_display,
+        'list_filter': list_filter,
+        'search_fields': search_fields,
+        'inlines': [ProductImageInline],
+        'show_full_result_count': False,
+    })
 
-@admin.register(Speakers)
-class SpeakersAdmin(admin.ModelAdmin):
-    form = SpeakersForm
-    list_display = ['brand', 'model_name', 'connection_type', 'wattage', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'connection_type', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
+# (model, form, list_display, list_filter, search_fields); sku is already in BASE_LIST_DISPLAY
+PRODUCT_ADMINS = [
+    (GPU, GPUForm,
+     (*BASE_LIST_DISPLAY, 'model', 'vram'),
+     (*BASE_LIST_FILTER, 'vram'),
+     (*BASE_SEARCH_FIELDS, 'description')),
+    (CPU, CPUForm,
+     (*BASE_LIST_DISPLAY, 'model', 'cores'),
+     (*BASE_LIST_FILTER, 'cores'),
+     (*BASE_SEARCH_FIELDS, 'description')),
+    (RAM, RAMForm,
+     (*BASE_LIST_DISPLAY, 'model_name', 'capacity'),
+     (*BASE_LIST_FILTER, 'capacity'),
+     (*BASE_SEARCH_FIELDS, 'description')),
+    (Motherboard, MotherboardForm,
+     ('brand', 'model', 'socket', 'condition', 'warranty', 'top_pick', 'price', 'sku'),
+     ('brand', 'socket', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model', 'sku', 'description')),
+    (Case, CaseForm,
+     ('brand', 'model', 'case_type', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'case_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model', 'sku', 'description')),
+    (StorageDevice, StorageDeviceForm,
+     ('brand', 'model_name', 'storage_type', 'capacity', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'storage_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (PSU, PSUForm,
+     ('brand', 'model_name', 'wattage', 'efficiency_rating', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'wattage', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (Monitor, MonitorForm,
+     ('brand', 'model_name', 'screen_size', 'resolution', 'condition', 'warranty', 'top_pick', 'price', 'sku'),
+     ('brand', 'panel_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (Mouse, MouseForm,
+     ('brand', 'model_name', 'connection_type', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'connection_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (Keyboard, KeyboardForm,
+     ('brand', 'model_name', 'keyboard_type', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'keyboard_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (Headset, HeadsetForm,
+     ('brand', 'model_name', 'connection_type', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'connection_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (Speakers, SpeakersForm,
+     ('brand', 'model_name', 'connection_type', 'wattage', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'connection_type', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+    (OtherAccessory, OtherAccessoryForm,
+     ('brand', 'model_name', 'category', 'condition', 'warranty', 'top_pick', 'sku'),
+     ('brand', 'category', 'condition', 'warranty', 'top_pick'),
+     ('brand', 'model_name', 'sku', 'description')),
+]
 
-@admin.register(OtherAccessory)
-class OtherAccessoryAdmin(admin.ModelAdmin):
-    form = OtherAccessoryForm
-    list_display = ['brand', 'model_name', 'category', 'condition', 'warranty', 'top_pick', 'sku']
-    list_filter = ['brand', 'category', 'condition', 'warranty', 'top_pick']
-    search_fields = ['brand', 'model_name', 'sku', 'description']
-    inlines = [ProductImageInline]
+for model, form_cls, display, filters, search in PRODUCT_ADMINS:
+    admin.site.register(model, make_admin(form_cls, display, filters, search))
 
 @admin.register(Tablet)
 class TabletAdmin(admin.ModelAdmin):
@@ -145,6 +131,7 @@ class TabletAdmin(admin.ModelAdmin):
         'cellular', 'pta_approved', 'condition', 'warranty', 'top_pick'
     ]
     search_fields = ['name', 'brand', 'model', 'sku', 'chipset', 'description']
+    show_full_result_count = False
     fieldsets = [
         ('Basic Information', {
             'fields': ['name', 'brand', 'model']
@@ -182,9 +169,10 @@ class TabletAdmin(admin.ModelAdmin):
 @admin.register(Laptop)
 class LaptopAdmin(admin.ModelAdmin):
     form = LaptopForm
-    list_display = BASE_LIST_DISPLAY + ['model_name', 'processor_model', 'ram_capacity']  # sku already in BASE_LIST_DISPLAY
-    list_filter = BASE_LIST_FILTER + ['processor_brand', 'ram_capacity', 'storage_type']
-    search_fields = BASE_SEARCH_FIELDS + ['processor_model', 'model_name', 'description']
+    list_display = (*BASE_LIST_DISPLAY, 'model_name', 'processor_model', 'ram_capacity')  # sku already in BASE_LIST_DISPLAY
+    list_filter = (*BASE_LIST_FILTER, 'processor_brand', 'ram_capacity', 'storage_type')
+    search_fields = (*BASE_SEARCH_FIELDS, 'processor_model', 'model_name', 'description')
+    show_full_result_count = False
     fieldsets = [
         ('Basic Information', {
             'fields': ['name', 'brand', 'model_name']
@@ -277,6 +265,7 @@ class SubscriberAdmin(admin.ModelAdmin):
     list_filter = ('is_active', 'date_subscribed')
     search_fields = ('email',)
     date_hierarchy = 'date_subscribed'
+    show_full_result_count = False
 
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
@@ -285,6 +274,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
     search_fields = ('name', 'email', 'subject', 'message')
     readonly_fields = ('name', 'email', 'subject', 'message', 'submitted_at')
     ordering = ('-submitted_at',)
+    show_full_result_count = False
 
 @admin.register(SiteNumber)
 class SiteNumberAdmin(admin.ModelAdmin):
@@ -292,6 +282,6 @@ class SiteNumberAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):
         # Only allow one instance
-        if SiteNumber.objects.count() >= 1:
+        if cache.get_or_set(SiteNumber.EXISTS_CACHE_KEY, SiteNumber.objects.exists, 300):
             return False
         return super().has_add_permission(request)
\ No newline at end of file
@@ -1,9 +1,11 @@
-from .models import SiteNumber
+from django.utils.functional import SimpleLazyObject
+from .models import SiteNumber, cached_category_counts
 
 def site_number(request):
-    number = None
-    try:
-        number = SiteNumber.objects.first()
-    except:
-        number = None
-    return {'site_number': number.number if number else ''} 
\ No newline at end of file
+    # Not listed in TEMPLATES and no template renders {{ site_number }}, so it stays uncached
+    number = SiteNumber.objects.values_list('number', flat=True).first()
+    return {'site_number': number or ''}
+
+def category_counts(request):
+    # Lazy so pages that show no counts never touch the cache
+    return {'category_counts': SimpleLazyObject(cached_category_counts)}
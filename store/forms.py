@@ -5,95 +5,177 @@ from .models import (
     OtherAccessory, Tablet, Laptop, Subscriber, ContactMessage
 )
 
+# Attributes shared by every field on the contact page
+CONTACT_ATTRS = {'class': 'ggt-contact-form-control', 'required': True}
+
 class GPUForm(forms.ModelForm):
     class Meta:
         model = GPU
-        fields = '__all__'
-        exclude = ['sku']  # SKU is auto-generated
+        # sku is generated on save, so it is never part of the form
+        fields = [
+            'name', 'brand', 'model', 'vram', 'memory_type', 'condition',
+            'warranty', 'top_pick', 'price', 'interface', 'clock_speed',
+            'boost_clock_speed', 'cuda_cores', 'stream_processors', 'length',
+            'tdp', 'recommended_psu', 'directx_support', 'opengl_support',
+            'ray_tracing_support', 'dlss_support', 'ports', 'multi_gpu_support',
+            'power_connectors', 'cooling_system', 'description'
+        ]
 
 class CPUForm(forms.ModelForm):
     class Meta:
         model = CPU
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model', 'socket', 'cores', 'threads', 'cache',
+            'base_clock_speed', 'boost_clock_speed', 'tdp',
+            'integrated_graphics', 'overclockable', 'power_connectors', 'price',
+            'cooling_solution', 'features', 'condition', 'warranty', 'top_pick',
+            'description'
+        ]
 
 class RAMForm(forms.ModelForm):
     class Meta:
         model = RAM
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'ram_type', 'capacity', 'speed',
+            'form_factor', 'voltage', 'ecc_support', 'rgb_lighting',
+            'condition', 'warranty', 'top_pick', 'price', 'description'
+        ]
 
 class MotherboardForm(forms.ModelForm):
     class Meta:
         model = Motherboard
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'model', 'brand', 'socket', 'chipset', 'form_factor',
+            'ram_type', 'ram_slots', 'max_ram', 'pcie_version', 'pcie_slots',
+            'sata_ports', 'm2_slots', 'usb_ports', 'has_wifi', 'ethernet_speed',
+            'has_rgb', 'power_connectors', 'price', 'condition', 'warranty',
+            'top_pick', 'description'
+        ]
 
 class CaseForm(forms.ModelForm):
     class Meta:
         model = Case
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'model', 'brand', 'case_type', 'supported_motherboards',
+            'width_mm', 'height_mm', 'depth_mm', 'width_in', 'height_in',
+            'depth_in', 'io_ports', 'drive_bays_35', 'drive_bays_25',
+            'horizontal_slots', 'vertical_slots', 'vertical_gpu_support',
+            'max_fan_mounts', 'preinstalled_fans', 'fan_speeds',
+            'fan_connectors', 'water_cooling_support', 'has_tempered_glass',
+            'has_rgb_sync', 'max_gpu_length', 'max_cpu_cooler_height',
+            'max_psu_length', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class StorageDeviceForm(forms.ModelForm):
     class Meta:
         model = StorageDevice
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'storage_type', 'capacity',
+            'interface', 'form_factor', 'cache_size', 'rpm_speed', 'read_speed',
+            'write_speed', 'tbw', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class PSUForm(forms.ModelForm):
     class Meta:
         model = PSU
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'wattage', 'efficiency_rating',
+            'modular_type', 'form_factor', 'pci_e_connectors',
+            'cpu_power_connectors', 'sata_connectors', 'molex_connectors',
+            'has_ocp', 'has_ovp', 'has_uvp', 'has_scp', 'has_opp', 'has_otp',
+            'condition', 'warranty', 'top_pick', 'price', 'description'
+        ]
 
 class MonitorForm(forms.ModelForm):
     class Meta:
         model = Monitor
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'screen_size', 'panel_type',
+            'refresh_rate', 'resolution', 'aspect_ratio', 'has_hdmi',
+            'has_displayport', 'has_usb_c', 'has_vga', 'supports_gsync',
+            'supports_freesync', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class MouseForm(forms.ModelForm):
     class Meta:
         model = Mouse
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'connection_type', 'dpi', 'buttons',
+            'has_rgb', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class KeyboardForm(forms.ModelForm):
     class Meta:
         model = Keyboard
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'connection_type', 'keyboard_type',
+            'has_rgb', 'num_keys', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class HeadsetForm(forms.ModelForm):
     class Meta:
         model = Headset
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'connection_type', 'has_microphone',
+            'surround_sound', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class SpeakersForm(forms.ModelForm):
     class Meta:
         model = Speakers
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'connection_type', 'wattage',
+            'has_subwoofer', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class OtherAccessoryForm(forms.ModelForm):
     class Meta:
         model = OtherAccessory
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'category', 'condition', 'warranty',
+            'top_pick', 'price', 'description'
+        ]
 
 class TabletForm(forms.ModelForm):
     class Meta:
         model = Tablet
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model', 'screen_size', 'screen_type',
+            'resolution', 'refresh_rate', 'chipset', 'ram', 'storage',
+            'battery_capacity', 'fast_charging', 'wireless_charging',
+            'charging_wattage', 'rear_camera_mp', 'front_camera_mp',
+            'pta_approved', 'cellular', 'sim_type', 'usb_type',
+            'headphone_jack', 'sd_card_slot', 'os', 'os_version', 'weight',
+            'dimensions', 'material', 'stylus_support', 'keyboard_support',
+            'biometric_auth', 'condition', 'warranty', 'top_pick', 'price',
+            'description'
+        ]
 
 class LaptopForm(forms.ModelForm):
     class Meta:
         model = Laptop
-        fields = '__all__'
-        exclude = ['sku']
+        fields = [
+            'name', 'brand', 'model_name', 'processor_brand', 'processor_model',
+            'processor_generation', 'core_count', 'base_clock', 'boost_clock',
+            'ram_capacity', 'ram_type', 'ram_speed', 'storage_type',
+            'storage_capacity', 'screen_size', 'resolution', 'refresh_rate',
+            'display_type', 'brightness', 'touch_screen', 'gpu_brand',
+            'gpu_model', 'gpu_memory', 'battery_capacity', 'battery_life',
+            'power_adapter', 'fast_charging', 'wifi_standard',
+            'bluetooth_version', 'usb_ports', 'hdmi_ports', 'ethernet_port',
+            'headphone_jack', 'card_reader', 'weight', 'dimensions',
+            'build_material', 'color', 'backlit_keyboard', 'fingerprint_sensor',
+            'numeric_keypad', 'webcam_resolution', 'speakers', 'microphone',
+            'operating_system', 'os_version', 'warranty_info', 'condition',
+            'warranty', 'top_pick', 'price', 'description'
+        ]
 
 class SubscriberForm(forms.ModelForm):
     class Meta:
@@ -106,37 +188,20 @@ class SubscriberForm(forms.ModelForm):
                 'required': True
             })
         }
-
-    def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if Subscriber.objects.filter(email=email).exists():
-            raise forms.ValidationError("This email is already subscribed to our newsletter.")
-        return email
+        # Duplicates are caught by the unique index during validate_unique()
+        error_messages = {
+            'email': {
+                'unique': "This email is already subscribed to our newsletter.",
+            }
+        }
 
 class ContactForm(forms.ModelForm):
     class Meta:
         model = ContactMessage
         fields = ['name', 'email', 'subject', 'message']
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'ggt-contact-form-control',
-                'placeholder': 'Your Name',
-                'required': True
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'ggt-contact-form-control',
-                'placeholder': 'Your Email',
-                'required': True
-            }),
-            'subject': forms.TextInput(attrs={
-                'class': 'ggt-contact-form-control',
-                'placeholder': 'Subject',
-                'required': True
-            }),
-            'message': forms.Textarea(attrs={
-                'class': 'ggt-contact-form-control',
-                'placeholder': 'Your Message',
-                'required': True,
-                'rows': 5
-            }),
-        } 
\ No newline at end of file
+            'name': forms.TextInput(attrs={**CONTACT_ATTRS, 'placeholder': 'Your Name'}),
+            'email': forms.EmailInput(attrs={**CONTACT_ATTRS, 'placeholder': 'Your Email'}),
+            'subject': forms.TextInput(attrs={**CONTACT_ATTRS, 'placeholder': 'Subject'}),
+            'message': forms.Textarea(attrs={**CONTACT_ATTRS, 'placeholder': 'Your Message', 'rows': 5}),
+        }
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0010_alter_case_fan_connectors_alter_case_fan_speeds_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-submitted_at', 'is_read'], name='cm_submitted_read_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(fields=['-date_subscribed', 'is_active'], name='sub_date_active_idx'),
+        ),
+    ]
@@ -0,0 +1,191 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0011_contactmessage_subscriber_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['brand', 'top_pick'], name='gpu_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['top_pick'], name='gpu_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['condition'], name='gpu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['brand', 'top_pick'], name='cpu_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['top_pick'], name='cpu_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['condition'], name='cpu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['brand', 'top_pick'], name='case_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['top_pick'], name='case_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['condition'], name='case_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['brand', 'top_pick'], name='ram_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['top_pick'], name='ram_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['condition'], name='ram_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['brand', 'top_pick'], name='motherboard_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['top_pick'], name='motherboard_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['condition'], name='motherboard_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['brand', 'top_pick'], name='tablet_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['top_pick'], name='tablet_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['condition'], name='tablet_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['brand', 'top_pick'], name='laptop_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['top_pick'], name='laptop_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['condition'], name='laptop_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['brand', 'top_pick'], name='storagedevice_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['top_pick'], name='storagedevice_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['condition'], name='storagedevice_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['brand', 'top_pick'], name='psu_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['top_pick'], name='psu_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['condition'], name='psu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['brand', 'top_pick'], name='monitor_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['top_pick'], name='monitor_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['condition'], name='monitor_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['brand', 'top_pick'], name='mouse_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['top_pick'], name='mouse_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['condition'], name='mouse_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['brand', 'top_pick'], name='keyboard_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['top_pick'], name='keyboard_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['condition'], name='keyboard_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['brand', 'top_pick'], name='headset_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['top_pick'], name='headset_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['condition'], name='headset_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['brand', 'top_pick'], name='speakers_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['top_pick'], name='speakers_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['condition'], name='speakers_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['brand', 'top_pick'], name='otheraccessory_brand_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['top_pick'], name='otheraccessory_pick_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['condition'], name='otheraccessory_cond_idx'),
+        ),
+    ]
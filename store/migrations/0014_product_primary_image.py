@@ -0,0 +1,100 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_primary_images(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    ProductImage = apps.get_model('store', 'ProductImage')
+    models_by_type = {}
+    for image in ProductImage.objects.filter(is_primary=True).order_by('uploaded_at'):
+        if image.content_type_id not in models_by_type:
+            content_type = ContentType.objects.get(pk=image.content_type_id)
+            models_by_type[image.content_type_id] = apps.get_model(content_type.app_label, content_type.model)
+        models_by_type[image.content_type_id].objects.filter(pk=image.object_id).update(primary_image=image.pk)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('store', '0013_skusequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gpu',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='cpu',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='ram',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='motherboard',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='tablet',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='laptop',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='storagedevice',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='psu',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='monitor',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='mouse',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='keyboard',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='headset',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='speakers',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.AddField(
+            model_name='otheraccessory',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='store.productimage'),
+        ),
+        migrations.RunPython(backfill_primary_images, migrations.RunPython.noop),
+    ]
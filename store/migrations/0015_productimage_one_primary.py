@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def drop_extra_primaries(apps, schema_editor):
+    ProductImage = apps.get_model('store', 'ProductImage')
+    seen = set()
+    extra = []
+    for image in ProductImage.objects.filter(is_primary=True).order_by('-uploaded_at', '-pk'):
+        key = (image.content_type_id, image.object_id)
+        if key in seen:
+            extra.append(image.pk)
+        seen.add(key)
+    ProductImage.objects.filter(pk__in=extra).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0014_product_primary_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_extra_primaries, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='productimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('content_type', 'object_id'), name='productimage_one_primary'),
+        ),
+    ]
@@ -0,0 +1,207 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0015_productimage_one_primary'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='gpu',
+            name='gpu_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['top_pick', 'price'], name='gpu_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['brand', 'condition'], name='gpu_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['vram', 'memory_type'], name='gpu_vram_memtype_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='cpu',
+            name='cpu_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['top_pick', 'price'], name='cpu_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['brand', 'condition'], name='cpu_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['socket', 'cores'], name='cpu_socket_cores_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='case',
+            name='case_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['top_pick', 'price'], name='case_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['brand', 'condition'], name='case_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['case_type', 'max_gpu_length'], name='case_type_gpu_len_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='ram',
+            name='ram_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['top_pick', 'price'], name='ram_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['brand', 'condition'], name='ram_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['ram_type', 'capacity', 'speed'], name='ram_type_cap_speed_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='motherboard',
+            name='motherboard_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['top_pick', 'price'], name='motherboard_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['brand', 'condition'], name='motherboard_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='tablet',
+            name='tablet_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['top_pick', 'price'], name='tablet_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['brand', 'condition'], name='tablet_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='laptop',
+            name='laptop_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['top_pick', 'price'], name='laptop_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['brand', 'condition'], name='laptop_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='storagedevice',
+            name='storagedevice_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['top_pick', 'price'], name='storagedevice_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['brand', 'condition'], name='storagedevice_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='psu',
+            name='psu_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['top_pick', 'price'], name='psu_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['brand', 'condition'], name='psu_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='monitor',
+            name='monitor_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['top_pick', 'price'], name='monitor_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['brand', 'condition'], name='monitor_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='mouse',
+            name='mouse_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['top_pick', 'price'], name='mouse_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['brand', 'condition'], name='mouse_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='keyboard',
+            name='keyboard_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['top_pick', 'price'], name='keyboard_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['brand', 'condition'], name='keyboard_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='headset',
+            name='headset_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['top_pick', 'price'], name='headset_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['brand', 'condition'], name='headset_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='speakers',
+            name='speakers_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['top_pick', 'price'], name='speakers_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['brand', 'condition'], name='speakers_brand_cond_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='otheraccessory',
+            name='otheraccessory_pick_idx',
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['top_pick', 'price'], name='otheraccessory_pick_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['brand', 'condition'], name='otheraccessory_brand_cond_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0019_laptop_price_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comparisonlist',
+            index=models.Index(fields=['session_key', 'product_type'], name='cmplist_session_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wishlistitem',
+            index=models.Index(fields=['session_key', '-added_at'], name='wish_session_added_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0020_comparison_wishlist_session_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comparisonitem',
+            index=models.Index(fields=['comparison_list', 'content_type', 'object_id'], name='cmpitem_list_target_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0021_comparisonitem_target_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comparisonitem',
+            index=models.Index(fields=['comparison_list', 'added_at'], name='cmpitem_list_added_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wishlistitem',
+            index=models.Index(fields=['user', '-added_at'], name='wish_user_added_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='slider',
+            index=models.Index(fields=['is_active', 'order', 'id'], name='slider_active_order_idx'),
+        ),
+    ]
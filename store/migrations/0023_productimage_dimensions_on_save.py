@@ -0,0 +1,32 @@
+import django.core.validators
+import store.models
+from django.core.files.images import get_image_dimensions
+from django.db import migrations, models
+
+
+def fill_dimensions(apps, schema_editor):
+    ProductImage = apps.get_model('store', 'ProductImage')
+    for image in ProductImage.objects.filter(width__isnull=True).only('pk', 'image').iterator():
+        try:
+            with image.image.open('rb') as f:
+                width, height = get_image_dimensions(f)
+        except OSError:
+            # File is missing or unreadable; leave the dimensions empty
+            continue
+        ProductImage.objects.filter(pk=image.pk).update(width=width, height=height)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0022_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productimage',
+            name='image',
+            field=models.ImageField(help_text='Product image (required, must be square 1:1 ratio)', upload_to='product_images/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp']), store.models.validate_square_image]),
+        ),
+        migrations.RunPython(fill_dimensions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicates(apps, schema_editor):
+    # Keep the oldest row of any duplicate left over from before the constraints
+    for model_name, fields in (
+        ('ComparisonItem', ('comparison_list', 'content_type', 'object_id')),
+        ('WishlistItem', ('user', 'session_key', 'content_type', 'object_id')),
+    ):
+        model = apps.get_model('store', model_name)
+        keep = model.objects.order_by().values(*fields).annotate(keep=Min('id')).values('keep')
+        model.objects.exclude(id__in=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0023_productimage_dimensions_on_save'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicates, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='comparisonitem',
+            name='cmpitem_list_target_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comparisonlist',
+            index=models.Index(fields=['user', 'product_type'], name='cmplist_user_type_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='comparisonitem',
+            constraint=models.UniqueConstraint(fields=('comparison_list', 'content_type', 'object_id'), name='cmpitem_unique_target'),
+        ),
+        migrations.AddConstraint(
+            model_name='wishlistitem',
+            constraint=models.UniqueConstraint(fields=('user', 'content_type', 'object_id'), name='wish_unique_user_target'),
+        ),
+        migrations.AddConstraint(
+            model_name='wishlistitem',
+            constraint=models.UniqueConstraint(fields=('session_key', 'content_type', 'object_id'), name='wish_unique_session_target'),
+        ),
+    ]
@@ -0,0 +1,309 @@
+# Generated by Django 5.1.7 on 2026-10-15 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0024_saved_product_unique_targets'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='case',
+            name='case_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='case',
+            name='case_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='cpu',
+            name='cpu_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='cpu',
+            name='cpu_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='gpu',
+            name='gpu_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='gpu',
+            name='gpu_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='headset',
+            name='headset_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='headset',
+            name='headset_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='keyboard',
+            name='keyboard_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='keyboard',
+            name='keyboard_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='laptop',
+            name='laptop_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='laptop',
+            name='laptop_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='monitor',
+            name='monitor_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='monitor',
+            name='monitor_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='motherboard',
+            name='motherboard_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='motherboard',
+            name='motherboard_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='mouse',
+            name='mouse_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='mouse',
+            name='mouse_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='otheraccessory',
+            name='otheraccessory_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='otheraccessory',
+            name='otheraccessory_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='psu',
+            name='psu_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='psu',
+            name='psu_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='ram',
+            name='ram_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='ram',
+            name='ram_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='speakers',
+            name='speakers_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='speakers',
+            name='speakers_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='storagedevice',
+            name='storagedevice_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='storagedevice',
+            name='storagedevice_brand_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablet',
+            name='tablet_cond_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablet',
+            name='tablet_brand_cond_idx',
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='case_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['condition', 'price'], name='case_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['price'], name='case_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='cpu_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['condition', 'price'], name='cpu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cpu',
+            index=models.Index(fields=['price'], name='cpu_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='gpu_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['condition', 'price'], name='gpu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gpu',
+            index=models.Index(fields=['price'], name='gpu_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='headset_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['condition', 'price'], name='headset_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='headset',
+            index=models.Index(fields=['price'], name='headset_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='keyboard_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['condition', 'price'], name='keyboard_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyboard',
+            index=models.Index(fields=['price'], name='keyboard_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='laptop_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laptop',
+            index=models.Index(fields=['condition', 'price'], name='laptop_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='monitor_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['condition', 'price'], name='monitor_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitor',
+            index=models.Index(fields=['price'], name='monitor_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='motherboard_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['condition', 'price'], name='motherboard_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motherboard',
+            index=models.Index(fields=['price'], name='motherboard_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='mouse_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['condition', 'price'], name='mouse_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mouse',
+            index=models.Index(fields=['price'], name='mouse_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='otheraccessory_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['condition', 'price'], name='otheraccessory_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otheraccessory',
+            index=models.Index(fields=['price'], name='otheraccessory_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='psu_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['condition', 'price'], name='psu_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='psu',
+            index=models.Index(fields=['price'], name='psu_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='ram_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['condition', 'price'], name='ram_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ram',
+            index=models.Index(fields=['price'], name='ram_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='speakers_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['condition', 'price'], name='speakers_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speakers',
+            index=models.Index(fields=['price'], name='speakers_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='storagedevice_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['condition', 'price'], name='storagedevice_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagedevice',
+            index=models.Index(fields=['price'], name='storagedevice_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['brand', 'condition', 'price'], name='tablet_brand_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['condition', 'price'], name='tablet_cond_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablet',
+            index=models.Index(fields=['price'], name='tablet_price_idx'),
+        ),
+    ]
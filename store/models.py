@@ -1,22 +1,146 @@
-from django.db import models
+from django.core import checks
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Value, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from django.core.validators import MinValueValidator, FileExtensionValidator, ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.images import get_image_dimensions
+import hashlib
+import time
+from io import BytesIO
+from pathlib import PurePosixPath
 from PIL import Image
-import uuid
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-import os
-from django.utils.text import slugify
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.utils.html import format_html
 
 def validate_square_image(image):
     """Validate that the image is square (1:1 ratio)"""
-    img = Image.open(image)
-    width, height = img.size
+    # Only feeds the header into PIL's parser and rewinds the file afterwards
+    width, height = get_image_dimensions(image)
+    if width is None:
+        raise ValidationError("Could not read the image dimensions.")
     if width != height:
         raise ValidationError(
             f"Image must be square (1:1 ratio). Current dimensions: {width}x{height}"
         )
 
+# Choices shared by every product model
+CONDITION_CHOICES = (
+    ('new', 'New'),
+    ('used', 'Used'),
+    ('refurbished', 'Refurbished'),
+    ('box_open', 'Box Open'),
+)
+
+WARRANTY_CHOICES = (
+    ('no_warranty', 'No Warranty'),
+    ('1_day', '1 Day'),
+    ('3_days', '3 Days'),
+    ('1_week', '1 Week'),
+    ('1_month', '1 Month'),
+    ('6_months', '6 Months'),
+    ('1_year', '1 Year'),
+    ('2_years', '2 Years'),
+    ('3_years', '3 Years'),
+)
+
+# Value -> label lookups for the shared choices
+CONDITION_DISPLAY = dict(CONDITION_CHOICES)
+WARRANTY_DISPLAY = dict(WARRANTY_CHOICES)
+
+# CPU and motherboard sockets
+SOCKET_CHOICES = (
+    # Intel Sockets
+    ('LGA 775', 'LGA 775'),
+    ('LGA 1156', 'LGA 1156'),
+    ('LGA 1155', 'LGA 1155'),
+    ('LGA 1150', 'LGA 1150'),
+    ('LGA 1151', 'LGA 1151'),
+    ('LGA 1200', 'LGA 1200'),
+    ('LGA 1366', 'LGA 1366'),
+    ('LGA 1567', 'LGA 1567'),
+    ('LGA 1700', 'LGA 1700'),
+    ('LGA 1851', 'LGA 1851'),
+    ('LGA 2011', 'LGA 2011'),
+    ('LGA 2011-3', 'LGA 2011-3'),
+    ('LGA 2066', 'LGA 2066'),
+    ('LGA 3647', 'LGA 3647'),
+    ('LGA 4189', 'LGA 4189'),
+    ('LGA 4677', 'LGA 4677'),
+    ('LGA 771', 'LGA 771'),
+    ('LGA 1356', 'LGA 1356'),
+    ('LGA 2551', 'LGA 2551'),
+
+    # AMD Sockets
+    ('AM3', 'AM3'),
+    ('AM3+', 'AM3+'),
+    ('AM4', 'AM4'),
+    ('AM5', 'AM5'),
+    ('FM1', 'FM1'),
+    ('FM2', 'FM2'),
+    ('FM2+', 'FM2+'),
+    ('TR4', 'TR4'),
+    ('sTRX4', 'sTRX4'),
+    ('sWRX8', 'sWRX8'),
+    ('sTR5', 'sTR5'),
+    ('SP3', 'SP3'),
+    ('SP5', 'SP5'),
+    ('SP6', 'SP6'),
+    ('G34', 'G34'),
+    ('C32', 'C32'),
+    ('F (1207)', 'F (1207)'),
+
+    # Legacy Sockets
+    ('Socket 423', 'Socket 423'),
+    ('Socket 478', 'Socket 478'),
+    ('Socket 754', 'Socket 754'),
+    ('Socket 939', 'Socket 939'),
+)
+
+class SkuSequence(models.Model):
+    """Single-row counter that hands out the unique part of product SKUs"""
+    value = models.PositiveBigIntegerField(default=0)
+
+SKU_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def reserve_sku_numbers(count=1):
+    """Reserve count consecutive SKU numbers and return them as a range"""
+    with transaction.atomic():
+        # The UPDATE takes the row lock, so concurrent callers never overlap
+        if not SkuSequence.objects.filter(pk=1).update(value=F('value') + count):
+            # Row lost to a flush or a fresh loaddata; recreate it and reserve again
+            SkuSequence.objects.get_or_create(pk=1)
+            SkuSequence.objects.filter(pk=1).update(value=F('value') + count)
+        end = SkuSequence.objects.values_list('value', flat=True).get(pk=1)
+    return range(end - count + 1, end + 1)
+
+def format_sku_suffix(number):
+    """Encode a reserved number as a zero-padded base36 string"""
+    digits = ''
+    while number:
+        number, rem = divmod(number, 36)
+        digits = SKU_DIGITS[rem] + digits
+    return digits.rjust(6, '0')
+
+CATALOG_VERSION_KEY = 'catalog_version'
+
+def catalog_cache_key(*parts):
+    """Cache key for catalog data that goes stale on the next product or image write"""
+    # Seeded from the clock so a lost version never reuses keys that may still be cached
+    version = cache.get_or_set(CATALOG_VERSION_KEY, time.time_ns, None)
+    return ':'.join(['catalog', str(version), *map(str, parts)])
+
+def bump_catalog_version():
+    """Invalidate every key built by catalog_cache_key"""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), None)
+
 class Subscriber(models.Model):
     email = models.EmailField(unique=True)
     date_subscribed = models.DateTimeField(default=timezone.now)
@@ -29,6 +153,52 @@ class Subscriber(models.Model):
         ordering = ['-date_subscribed']
         verbose_name = 'Subscriber'
         verbose_name_plural = 'Subscribers'
+        indexes = [
+            models.Index(fields=['-date_subscribed', 'is_active'], name='sub_date_active_idx'),
+        ]
+
+# Every column a product card reads; the specs are only shown on the detail page
+LISTING_FIELDS = ('id', 'name', 'brand', 'sku', 'price', 'condition', 'top_pick', 'primary_image')
+
+class ProductQuerySet(models.QuerySet):
+    def for_listing(self):
+        """Load only the LISTING_FIELDS columns, skipping the wide spec columns"""
+        return self.only(*LISTING_FIELDS)
+
+    def with_images(self):
+        """Prefetch the images GenericRelation the product cards render"""
+        return self.prefetch_related('images')
+
+    def bulk_create_with_sku(self, objs, batch_size=1000):
+        """bulk_create products, numbering their SKUs from a single counter reservation"""
+        objs = list(objs)
+        pending = [obj for obj in objs if not obj.sku]
+        if pending:
+            for obj, number in zip(pending, reserve_sku_numbers(len(pending))):
+                obj.assign_sku(number)
+        created = self.bulk_create(objs, batch_size=batch_size)
+        # bulk_create sends no post_save, so invalidate cached listings here
+        transaction.on_commit(bump_catalog_version)
+        return created
+
+def content_addressed_name(image):
+    """Name an upload after the BLAKE2 hash of its contents, keeping the extension"""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in image.chunks():
+        digest.update(chunk)
+    image.seek(0)
+    hexdigest = digest.hexdigest()
+    return f'{hexdigest[:2]}/{hexdigest}{PurePosixPath(image.name).suffix.lower()}'
+
+# Widths of the resized copies generated for every uploaded product image
+VARIANT_WIDTHS = (256, 512, 1024)
+
+class ProductImageQuerySet(models.QuerySet):
+    def with_targets(self):
+        """Prefetch the products behind content_object, one query per product type"""
+        return self.prefetch_related(GenericPrefetch('content_object', [
+            model.objects.only('id', 'sku', *fields) for model, fields in IMAGE_TARGET_FIELDS.items()
+        ]))
 
 class ProductImage(models.Model):
     """Model to store images for all products"""
@@ -42,6 +212,11 @@ class ProductImage(models.Model):
         blank=False,
         help_text="Product image (required, must be square 1:1 ratio)"
     )
+    # Read once at upload so templates can reserve space without opening the file
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Downsized WebP copies keyed by width, written once when the file is uploaded
+    variants = models.JSONField(default=dict, blank=True, editable=False)
     alt_text = models.CharField(
         max_length=100, 
         blank=False,
@@ -59,38 +234,222 @@ class ProductImage(models.Model):
     
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProductImageQuerySet.as_manager()
+
     class Meta:
         ordering = ['-is_primary', '-uploaded_at']
         indexes = [
             models.Index(fields=["content_type", "object_id"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id'],
+                condition=Q(is_primary=True),
+                name='productimage_one_primary',
+            ),
+        ]
 
     def __str__(self):
         return f"Image for {self.content_object}"
+
+    def generate_variants(self):
+        """Write the VARIANT_WIDTHS WebP copies of the image and record their paths"""
+        storage = self.image.storage
+        # Keyed by the content hash the file is stored under, so duplicate uploads share them
+        digest = PurePosixPath(self.image.name).stem
+        variants = {
+            str(width): f'product_images/variants/{digest}/{width}.webp'
+            for width in VARIANT_WIDTHS
+            if not self.width or width < self.width
+        }
+        missing = {width: name for width, name in variants.items() if not storage.exists(name)}
+        if missing:
+            with self.image.open('rb') as f, Image.open(f) as source:
+                source = source.convert('RGBA' if source.mode in ('RGBA', 'LA', 'P') else 'RGB')
+                for width, name in missing.items():
+                    resized = source.copy()
+                    resized.thumbnail((int(width), int(width)))
+                    buffer = BytesIO()
+                    resized.save(buffer, format='WEBP', quality=82)
+                    storage.save(name, ContentFile(buffer.getvalue()))
+        self.variants = variants
+        ProductImage.objects.filter(pk=self.pk).update(variants=variants)
+
+    def srcset(self):
+        """srcset value covering the stored variants and the original file"""
+        candidates = [
+            f'{self.image.storage.url(path)} {width}w'
+            for width, path in sorted((int(width), path) for width, path in self.variants.items())
+        ]
+        if self.width:
+            candidates.append(f'{self.image.url} {self.width}w')
+        return ', '.join(candidates)
+
+    def render_tag(self, lcp=False, sizes=None, **extra):
+        """Return an <img> tag with dimensions, lazy-loaded unless it is the LCP image, plus any extra attributes"""
+        attrs = format_html('alt="{}"', self.alt_text)
+        if self.width and self.height:
+            attrs = format_html('{} width="{}" height="{}"', attrs, self.width, self.height)
+        if self.variants:
+            attrs = format_html('{} srcset="{}"', attrs, self.srcset())
+            if sizes:
+                attrs = format_html('{} sizes="{}"', attrs, sizes)
+        if lcp:
+            attrs = format_html('{} fetchpriority="high"', attrs)
+        else:
+            attrs = format_html('{} loading="lazy" decoding="async"', attrs)
+        for name, value in extra.items():
+            attrs = format_html('{} {}="{}"', attrs, name, value)
+        return format_html('<img src="{}" {}>', self.image.url, attrs)
+
+    def validate_constraints(self, exclude=None):
+        # save() demotes the previous primary, so forms shouldn't reject a new one
+        exclude = {*(exclude or ()), 'object_id'}
+        super().validate_constraints(exclude=exclude)
     
     def save(self, *args, **kwargs):
         """Override save to ensure only one primary image per product"""
-        if self.is_primary:
-            # Set all other images of this product to not primary
-            ProductImage.objects.filter(
-                content_type=self.content_type,
-                object_id=self.object_id,
-                is_primary=True
+        new_upload = not self.image._committed
+        if new_upload:
+            self.width, self.height = get_image_dimensions(self.image)
+            # Identical uploads share one stored file, named after its hash
+            relative_name = content_addressed_name(self.image)
+            name = self.image.field.generate_filename(self, relative_name)
+            if self.image.storage.exists(name):
+                self.image.name = name
+                self.image._committed = True
+            else:
+                self.image.save(relative_name, self.image.file, save=False)
+        with transaction.atomic():
+            if self.is_primary:
+                # Set all other images of this product to not primary
+                ProductImage.objects.filter(
+                    content_type_id=self.content_type_id,
+                    object_id=self.object_id,
+                    is_primary=True
+                ).exclude(pk=self.pk).update(is_primary=False)
+            super().save(*args, **kwargs)
+            # Mirror the flag onto the product's primary_image pointer
+            model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+            products = model._default_manager.filter(pk=self.object_id)
+            if self.is_primary:
+                products.update(primary_image=self)
+            else:
+                products.filter(primary_image=self).update(primary_image=None)
+        if new_upload:
+            self.generate_variants()
+
+    @classmethod
+    def for_object(cls, obj, **kwargs):
+        """Build an unsaved image for obj using the cached ContentType"""
+        content_type = ContentType.objects.get_for_model(obj)
+        return cls(content_type_id=content_type.pk, object_id=obj.pk, **kwargs)
+
+    @classmethod
+    def prefetch_for(cls, products, limit=None):
+        """Fill the images prefetch cache of products from any mix of models in one query"""
+        products = list(products)
+        ids_by_type = {}
+        for product in products:
+            content_type_id = ContentType.objects.get_for_model(product).pk
+            ids_by_type.setdefault(content_type_id, set()).add(product.pk)
+        if not ids_by_type:
+            return
+        lookup = Q()
+        for content_type_id, ids in ids_by_type.items():
+            lookup |= Q(content_type_id=content_type_id, object_id__in=ids)
+        images = cls.objects.filter(lookup)
+        if limit is not None:
+            # Only the first `limit` images of each product, in Meta.ordering
+            images = images.annotate(position=Window(
+                RowNumber(),
+                partition_by=[F('content_type_id'), F('object_id')],
+                order_by=cls._meta.ordering,
+            )).filter(position__lte=limit)
+        grouped = {}
+        for image in images:
+            grouped.setdefault((image.content_type_id, image.object_id), []).append(image)
+        for product in products:
+            # Same shape prefetch_related('images') leaves behind
+            queryset = product.images.all()
+            queryset._result_cache = grouped.get(
+                (ContentType.objects.get_for_model(product).pk, product.pk), []
+            )
+            queryset._prefetch_done = True
+            product.__dict__.setdefault('_prefetched_objects_cache', {})['images'] = queryset
+
+    @classmethod
+    def set_primary_bulk(cls, images):
+        """Make each of the given saved images the primary one for its product"""
+        # The last image wins when several belong to the same product
+        chosen = {(img.content_type_id, img.object_id): img.pk for img in images}
+        if not chosen:
+            return 0
+        products = Q()
+        for content_type_id, object_id in chosen:
+            products |= Q(content_type_id=content_type_id, object_id=object_id)
+        with transaction.atomic():
+            cls.objects.filter(products, is_primary=True).exclude(
+                pk__in=chosen.values()
             ).update(is_primary=False)
+            cls.objects.filter(pk__in=chosen.values()).update(is_primary=True)
+            by_type = {}
+            for (content_type_id, object_id), image_id in chosen.items():
+                by_type.setdefault(content_type_id, {})[object_id] = image_id
+            for content_type_id, pointers in by_type.items():
+                model = ContentType.objects.get_for_id(content_type_id).model_class()
+                model._default_manager.filter(pk__in=pointers).update(primary_image_id=models.Case(
+                    *[models.When(pk=pk, then=image_id) for pk, image_id in pointers.items()]
+                ))
+            transaction.on_commit(bump_catalog_version)
+        return len(chosen)
+
+class SkuMixin(models.Model):
+    """Fills in sku on first save from the model's sku_base() and the shared counter"""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def check(cls, **kwargs):
+        errors = super().check(**kwargs)
+        # Caught at startup rather than on the model's first save
+        if not callable(getattr(cls, 'sku_base', None)):
+            errors.append(checks.Error(
+                f"{cls.__name__} must define sku_base() to build its SKUs.",
+                obj=cls,
+                id='store.E001',
+            ))
+        return errors
+
+    def assign_sku(self, number):
+        """Set sku from sku_base() and a number reserved with reserve_sku_numbers()"""
+        self.sku = f"{self.sku_base()}{format_sku_suffix(number)}"
+
+    def save(self, *args, **kwargs):
+        if not self.sku:
+            self.assign_sku(reserve_sku_numbers()[0])
         super().save(*args, **kwargs)
 
-class BaseProduct(models.Model):
-    # ... existing fields
-    description = models.TextField(
-        null=False, 
-        default="This is a high-quality product with excellent performance and reliability. Perfect for both professional and personal use.",
-        help_text="Detailed description of the product"
+class BaseProduct(SkuMixin):
+    """Relations and manager shared by every product model"""
+    images = GenericRelation(ProductImage)
+    # Kept in sync by ProductImage.save so listings can select_related it
+    primary_image = models.ForeignKey(
+        ProductImage,
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+'
     )
-    
+
+    objects = ProductQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
-class GPU(models.Model):
+class GPU(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -99,12 +458,12 @@ class GPU(models.Model):
     )
     
     # Brand (Choices)
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('nvidia', 'NVIDIA'),
         ('amd', 'AMD'),
         ('intel', 'Intel'),
         ('other', 'Other'),
-    ]
+    )
     brand = models.CharField(
         max_length=20, 
         choices=BRAND_CHOICES, 
@@ -122,7 +481,7 @@ class GPU(models.Model):
     )
     
     # VRAM (Choices)
-    VRAM_CHOICES = [
+    VRAM_CHOICES = (
         (1, '1 GB'),
         (2, '2 GB'),
         (4, '4 GB'),
@@ -132,14 +491,14 @@ class GPU(models.Model):
         (12, '12 GB'),
         (16, '16 GB'),
         (24, '24 GB'),
-    ]
+    )
     vram = models.PositiveIntegerField(
         choices=VRAM_CHOICES, 
         help_text="The amount of VRAM in GB (e.g., 10 GB)"
     )
     
     # Memory Type (Choices)
-    MEMORY_TYPE_CHOICES = [
+    MEMORY_TYPE_CHOICES = (
         ('gddr3', 'GDDR3'),
         ('gddr4', 'GDDR4'),
         ('gddr5', 'GDDR5'),
@@ -150,7 +509,7 @@ class GPU(models.Model):
         ('hbm2', 'HBM2'),
         ('hbm2e', 'HBM2e'),
         ('hbm3', 'HBM3'),
-    ]
+    )
     memory_type = models.CharField(
         max_length=20, 
         choices=MEMORY_TYPE_CHOICES, 
@@ -159,12 +518,6 @@ class GPU(models.Model):
     )
     
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -172,17 +525,6 @@ class GPU(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -245,12 +587,12 @@ class GPU(models.Model):
     )
     
     # Cooling System (Optional)
-    COOLING_CHOICES = [
+    COOLING_CHOICES = (
         ('dual_fan', 'Dual Fan'),
         ('triple_fan', 'Triple Fan'),
         ('liquid_cooling', 'Liquid Cooling'),
         ('blower', 'Blower'),
-    ]
+    )
     cooling_system = models.CharField(
         max_length=50, 
         choices=COOLING_CHOICES, 
@@ -276,21 +618,24 @@ class GPU(models.Model):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        # Generate a numeric SKU automatically
-        if not self.sku:
-            # Create a base number using brand, model, and vram
-            base_number = f"{self.brand[:3]}{self.model[:3]}{self.vram}"
-            # Add a unique identifier (last 6 digits of UUID)
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        # Create a base number using brand, model, and vram
+        return f"{self.brand[:3]}{self.model[:3]}{self.vram}"
 
     class Meta:
         verbose_name = "GPU"
         verbose_name_plural = "GPUs"
+        indexes = [
+            # Match the brand / condition / top_pick admin filters
+            models.Index(fields=['brand', 'top_pick'], name='gpu_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='gpu_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='gpu_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='gpu_cond_idx'),
+            models.Index(fields=['price'], name='gpu_price_idx'),
+            models.Index(fields=['vram', 'memory_type'], name='gpu_vram_memtype_idx'),
+        ]
 
-class CPU(models.Model):
+class CPU(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -299,11 +644,11 @@ class CPU(models.Model):
     )
 
     # Brand Choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('intel', 'Intel'),
         ('amd', 'AMD'),
         ('other', 'Other'),
-    ]
+    )
     brand = models.CharField(
         max_length=20, 
         choices=BRAND_CHOICES, 
@@ -321,53 +666,6 @@ class CPU(models.Model):
     )
 
     # Socket Types
-    SOCKET_CHOICES = [
-        # Intel Sockets
-        ('LGA 775', 'LGA 775'),
-        ('LGA 1156', 'LGA 1156'),
-        ('LGA 1155', 'LGA 1155'),
-        ('LGA 1150', 'LGA 1150'),
-        ('LGA 1151', 'LGA 1151'),
-        ('LGA 1200', 'LGA 1200'),
-        ('LGA 1366', 'LGA 1366'),
-        ('LGA 1567', 'LGA 1567'),
-        ('LGA 1700', 'LGA 1700'),
-        ('LGA 1851', 'LGA 1851'),
-        ('LGA 2011', 'LGA 2011'),
-        ('LGA 2011-3', 'LGA 2011-3'),
-        ('LGA 2066', 'LGA 2066'),
-        ('LGA 3647', 'LGA 3647'),
-        ('LGA 4189', 'LGA 4189'),
-        ('LGA 4677', 'LGA 4677'),
-        ('LGA 771', 'LGA 771'),
-        ('LGA 1356', 'LGA 1356'),
-        ('LGA 2551', 'LGA 2551'),
-
-        # AMD Sockets
-        ('AM3', 'AM3'),
-        ('AM3+', 'AM3+'),
-        ('AM4', 'AM4'),
-        ('AM5', 'AM5'),
-        ('FM1', 'FM1'),
-        ('FM2', 'FM2'),
-        ('FM2+', 'FM2+'),
-        ('TR4', 'TR4'),
-        ('sTRX4', 'sTRX4'),
-        ('sWRX8', 'sWRX8'),
-        ('sTR5', 'sTR5'),
-        ('SP3', 'SP3'),
-        ('SP5', 'SP5'),
-        ('SP6', 'SP6'),
-        ('G34', 'G34'),
-        ('C32', 'C32'),
-        ('F (1207)', 'F (1207)'),
-
-        # Legacy Sockets
-        ('Socket 423', 'Socket 423'),
-        ('Socket 478', 'Socket 478'),
-        ('Socket 754', 'Socket 754'),
-        ('Socket 939', 'Socket 939'),
-    ]
     socket = models.CharField(
         max_length=20,
         choices=SOCKET_CHOICES,
@@ -375,7 +673,7 @@ class CPU(models.Model):
     )
 
     # Core Count
-    CORES_CHOICES = [
+    CORES_CHOICES = (
         (1, '1 Core'),
         (2, '2 Cores'),
         (4, '4 Cores'),
@@ -390,14 +688,14 @@ class CPU(models.Model):
         (64, '64 Cores'),
         (96, '96 Cores'),
         (128, '128 Cores'),
-    ]
+    )
     cores = models.PositiveIntegerField(
         choices=CORES_CHOICES,
         help_text="Number of CPU cores"
     )
 
     # Threads Count
-    THREADS_CHOICES = [
+    THREADS_CHOICES = (
         (2, '2 Threads'),
         (4, '4 Threads'),
         (8, '8 Threads'),
@@ -411,14 +709,14 @@ class CPU(models.Model):
         (128, '128 Threads'),
         (192, '192 Threads'),
         (256, '256 Threads'),
-    ]
+    )
     threads = models.PositiveIntegerField(
         choices=THREADS_CHOICES,
         help_text="Number of CPU threads"
     )
 
     # Cache Memory (L3 Cache)
-    CACHE_CHOICES = [
+    CACHE_CHOICES = (
         (2, '2 MB'),
         (4, '4 MB'),
         (6, '6 MB'),
@@ -430,7 +728,7 @@ class CPU(models.Model):
         (64, '64 MB'),
         (96, '96 MB'),
         (128, '128 MB'),
-    ]
+    )
     cache = models.PositiveIntegerField(
         choices=CACHE_CHOICES,
         help_text="L3 Cache size in MB"
@@ -471,16 +769,7 @@ class CPU(models.Model):
     # Additional Features
     features = models.TextField(blank=True, help_text="Additional features like PCIe version support, memory compatibility, etc.")
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -488,17 +777,6 @@ class CPU(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -521,25 +799,29 @@ class CPU(models.Model):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model[:3]}{self.cores}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model[:3]}{self.cores}"
 
     class Meta:
         verbose_name = "CPU"
         verbose_name_plural = "CPUs"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='cpu_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='cpu_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='cpu_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='cpu_cond_idx'),
+            models.Index(fields=['price'], name='cpu_price_idx'),
+            models.Index(fields=['socket', 'cores'], name='cpu_socket_cores_idx'),
+        ]
 
-class Case(models.Model):
+class Case(BaseProduct):
     # Basic Information
     name = models.CharField(max_length=255, unique=True, help_text="The name of the PC case (e.g., MX600 RGB)")
     model = models.CharField(max_length=100, help_text="The model of the case (e.g., MX600 RGB White)")
     brand = models.CharField(max_length=100, help_text="The brand of the case (e.g., Cooler Master, Corsair, NZXT)")
 
     # Case Form Factor
-    CASE_TYPE_CHOICES = [
+    CASE_TYPE_CHOICES = (
         ('Full Tower', 'Full Tower'),
         ('Mid Tower', 'Mid Tower'),
         ('Mini Tower', 'Mini Tower'),
@@ -549,7 +831,7 @@ class Case(models.Model):
         ('Cube Case', 'Cube Case'),
         ('Open-Air', 'Open-Air'),
         ('Rackmount', 'Rackmount'),
-    ]
+    )
     case_type = models.CharField(
         max_length=50,
         choices=CASE_TYPE_CHOICES,
@@ -632,12 +914,6 @@ class Case(models.Model):
     sku = models.CharField(max_length=20, unique=True, editable=False)
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -645,17 +921,6 @@ class Case(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -668,7 +933,6 @@ class Case(models.Model):
         default=False, 
         help_text="Is this case a top pick?"
     )
-    images = GenericRelation(ProductImage)
     # Price (Optional)
     price = models.DecimalField(
         max_digits=10, 
@@ -687,18 +951,22 @@ class Case(models.Model):
     def __str__(self):
         return f"{self.brand} {self.name} - {self.model}"
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model[:3]}{self.case_type[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model[:3]}{self.case_type[:3]}"
 
     class Meta:
         verbose_name = "PC Case"
         verbose_name_plural = "PC Cases"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='case_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='case_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='case_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='case_cond_idx'),
+            models.Index(fields=['price'], name='case_price_idx'),
+            models.Index(fields=['case_type', 'max_gpu_length'], name='case_type_gpu_len_idx'),
+        ]
 
-class RAM(models.Model):
+class RAM(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -706,7 +974,7 @@ class RAM(models.Model):
         help_text="Full product name (e.g., Corsair Vengeance RGB Pro 32GB DDR4-3600)"
     )
     # Predefined brand choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('Corsair', 'Corsair'),
         ('G.Skill', 'G.Skill'),
         ('Kingston', 'Kingston'),
@@ -717,19 +985,19 @@ class RAM(models.Model):
         ('TeamGroup', 'TeamGroup'),
         ('Patriot', 'Patriot'),
         ('T-Force', 'T-Force'),
-    ]
+    )
 
     # RAM Type choices
-    RAM_TYPE_CHOICES = [
+    RAM_TYPE_CHOICES = (
         ('DDR2', 'DDR2'),
         ('DDR3', 'DDR3'),
         ('DDR3L', 'DDR3L'),
         ('DDR4', 'DDR4'),
         ('DDR5', 'DDR5'),
-    ]
+    )
 
     # Capacity choices
-    CAPACITY_CHOICES = [
+    CAPACITY_CHOICES = (
         (2, '2GB'),
         (4, '4GB'),
         (8, '8GB'),
@@ -738,13 +1006,13 @@ class RAM(models.Model):
         (64, '64GB'),
         (128, '128GB'),
         (256, '256GB'),
-    ]
+    )
 
     # Form Factor choices
-    FORM_FACTOR_CHOICES = [
+    FORM_FACTOR_CHOICES = (
         ('DIMM', 'DIMM (Desktop)'),
         ('SODIMM', 'SODIMM (Laptop)'),
-    ]
+    )
 
     brand = models.CharField(max_length=50, choices=BRAND_CHOICES)
     model_name = models.CharField(max_length=100, help_text="e.g., Vengeance LPX, Ripjaws V, Ballistix Elite")
@@ -760,12 +1028,6 @@ class RAM(models.Model):
     rgb_lighting = models.BooleanField(default=False, help_text="Does it have RGB lighting?")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -773,17 +1035,6 @@ class RAM(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -797,9 +1048,6 @@ class RAM(models.Model):
         help_text="Is this RAM a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -822,23 +1070,29 @@ class RAM(models.Model):
         help_text="Detailed description of the RAM"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.capacity}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.capacity}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} {self.capacity}GB {self.ram_type} {self.speed}MHz"
 
-class Motherboard(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='ram_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='ram_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='ram_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='ram_cond_idx'),
+            models.Index(fields=['price'], name='ram_price_idx'),
+            models.Index(fields=['ram_type', 'capacity', 'speed'], name='ram_type_cap_speed_idx'),
+        ]
+
+class Motherboard(BaseProduct):
     # Basic Information
     name = models.CharField(max_length=255, unique=True, help_text="The name of the motherboard (e.g., ASUS ROG STRIX Z690-E)")
     model = models.CharField(max_length=100, help_text="The model of the motherboard (e.g., ROG STRIX Z690-E)")
 
     # Brand Choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         # 🔹 Mainstream Brands
         ('asus', 'ASUS'),
         ('msi', 'MSI'),
@@ -861,7 +1115,7 @@ class Motherboard(models.Model):
         ('hp', 'HP'),
         ('lenovo', 'Lenovo'),
         ('acer', 'Acer'),
-    ]
+    )
     brand = models.CharField(
         max_length=20,
         choices=BRAND_CHOICES,
@@ -869,53 +1123,6 @@ class Motherboard(models.Model):
     )
 
     # CPU Socket Compatibility
-    SOCKET_CHOICES = [
-        # Intel Sockets
-        ('LGA 775', 'LGA 775'),
-        ('LGA 1156', 'LGA 1156'),
-        ('LGA 1155', 'LGA 1155'),
-        ('LGA 1150', 'LGA 1150'),
-        ('LGA 1151', 'LGA 1151'),
-        ('LGA 1200', 'LGA 1200'),
-        ('LGA 1366', 'LGA 1366'),
-        ('LGA 1567', 'LGA 1567'),
-        ('LGA 1700', 'LGA 1700'),
-        ('LGA 1851', 'LGA 1851'),
-        ('LGA 2011', 'LGA 2011'),
-        ('LGA 2011-3', 'LGA 2011-3'),
-        ('LGA 2066', 'LGA 2066'),
-        ('LGA 3647', 'LGA 3647'),
-        ('LGA 4189', 'LGA 4189'),
-        ('LGA 4677', 'LGA 4677'),
-        ('LGA 771', 'LGA 771'),
-        ('LGA 1356', 'LGA 1356'),
-        ('LGA 2551', 'LGA 2551'),
-
-        # AMD Sockets
-        ('AM3', 'AM3'),
-        ('AM3+', 'AM3+'),
-        ('AM4', 'AM4'),
-        ('AM5', 'AM5'),
-        ('FM1', 'FM1'),
-        ('FM2', 'FM2'),
-        ('FM2+', 'FM2+'),
-        ('TR4', 'TR4'),
-        ('sTRX4', 'sTRX4'),
-        ('sWRX8', 'sWRX8'),
-        ('sTR5', 'sTR5'),
-        ('SP3', 'SP3'),
-        ('SP5', 'SP5'),
-        ('SP6', 'SP6'),
-        ('G34', 'G34'),
-        ('C32', 'C32'),
-        ('F (1207)', 'F (1207)'),
-
-        # Legacy Sockets
-        ('Socket 423', 'Socket 423'),
-        ('Socket 478', 'Socket 478'),
-        ('Socket 754', 'Socket 754'),
-        ('Socket 939', 'Socket 939'),
-    ]
     socket = models.CharField(
         max_length=20,
         choices=SOCKET_CHOICES,
@@ -926,7 +1133,7 @@ class Motherboard(models.Model):
     chipset = models.CharField(max_length=100, help_text="Chipset (e.g., Z690, B550, X570, H610)")
 
     # Form Factor
-    FORM_FACTOR_CHOICES = [
+    FORM_FACTOR_CHOICES = (
         ('ATX', 'ATX'),
         ('Micro-ATX', 'Micro-ATX'),
         ('Mini-ITX', 'Mini-ITX'),
@@ -934,7 +1141,7 @@ class Motherboard(models.Model):
         ('XL-ATX', 'XL-ATX'),
         ('SSI-CEB', 'SSI-CEB'),
         ('SSI-EEB', 'SSI-EEB'),
-    ]
+    )
     form_factor = models.CharField(
         max_length=20,
         choices=FORM_FACTOR_CHOICES,
@@ -942,14 +1149,14 @@ class Motherboard(models.Model):
     )
 
     # RAM Support
-    RAM_TYPE_CHOICES = [
+    RAM_TYPE_CHOICES = (
         ('DDR', 'DDR'),
         ('DDR2', 'DDR2'),
         ('DDR3', 'DDR3'),
         ('DDR3L', 'DDR3L'),
         ('DDR4', 'DDR4'),
         ('DDR5', 'DDR5'),
-    ]
+    )
     ram_type = models.CharField(
         max_length=10,
         choices=RAM_TYPE_CHOICES,
@@ -964,11 +1171,11 @@ class Motherboard(models.Model):
     )
 
     # PCIe Slots
-    PCIe_VERSION_CHOICES = [
+    PCIe_VERSION_CHOICES = (
         ('PCIe 3.0', 'PCIe 3.0'),
         ('PCIe 4.0', 'PCIe 4.0'),
         ('PCIe 5.0', 'PCIe 5.0'),
-    ]
+    )
     pcie_version = models.CharField(
         max_length=10,
         choices=PCIe_VERSION_CHOICES,
@@ -1016,9 +1223,6 @@ class Motherboard(models.Model):
         help_text="The price of the motherboard"
     )
 
-    # Images
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -1027,12 +1231,6 @@ class Motherboard(models.Model):
     )
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -1040,17 +1238,6 @@ class Motherboard(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -1073,18 +1260,21 @@ class Motherboard(models.Model):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model[:3]}{self.socket[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model[:3]}{self.socket[:3]}"
 
     class Meta:
         verbose_name = "Motherboard"
         verbose_name_plural = "Motherboards"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='motherboard_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='motherboard_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='motherboard_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='motherboard_cond_idx'),
+            models.Index(fields=['price'], name='motherboard_price_idx'),
+        ]
 
-class Tablet(models.Model):
+class Tablet(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -1093,7 +1283,7 @@ class Tablet(models.Model):
     )
     
     # Brand Choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ("Apple", "Apple"),
         ("Samsung", "Samsung"),
         ("Lenovo", "Lenovo"),
@@ -1108,7 +1298,7 @@ class Tablet(models.Model):
         ("Docomo", "Docomo"),
         ("Alcatel", "Alcatel"),
         ("Honor", "Honor"),
-    ]
+    )
     brand = models.CharField(
         max_length=50, 
         choices=BRAND_CHOICES,
@@ -1130,7 +1320,7 @@ class Tablet(models.Model):
     chipset = models.CharField(max_length=100, help_text="Processor model (e.g., Apple M2, Snapdragon 8 Gen 1)")
 
     # RAM Choices
-    RAM_CHOICES = [
+    RAM_CHOICES = (
         (2, "2GB"),
         (3, "3GB"),
         (4, "4GB"),
@@ -1138,14 +1328,14 @@ class Tablet(models.Model):
         (8, "8GB"),
         (12, "12GB"),
         (16, "16GB"),
-    ]
+    )
     ram = models.PositiveIntegerField(
         choices=RAM_CHOICES,
         help_text="Select RAM size"
     )
 
     # Storage Choices
-    STORAGE_CHOICES = [
+    STORAGE_CHOICES = (
         (32, "32GB"),
         (64, "64GB"),
         (128, "128GB"),
@@ -1153,7 +1343,7 @@ class Tablet(models.Model):
         (512, "512GB"),
         (1024, "1TB"),
         (2048, "2TB"),
-    ]
+    )
     storage = models.PositiveIntegerField(
         choices=STORAGE_CHOICES,
         help_text="Select internal storage (ROM) size"
@@ -1194,12 +1384,6 @@ class Tablet(models.Model):
     biometric_auth = models.CharField(max_length=50, help_text="Biometric authentication (e.g., Face ID, Fingerprint)")
 
     # Condition (Required)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES,
@@ -1207,17 +1391,6 @@ class Tablet(models.Model):
     )
     
     # Warranty
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES,
@@ -1231,9 +1404,6 @@ class Tablet(models.Model):
         help_text="Is this tablet a top pick?"
     )
     
-    # Images
-    images = GenericRelation(ProductImage)
-    
     # SKU
     sku = models.CharField(
         max_length=20,
@@ -1257,12 +1427,8 @@ class Tablet(models.Model):
         help_text="Detailed description of the tablet"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model[:3]}{self.ram}{self.storage}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model[:3]}{self.ram}{self.storage}"
 
     def __str__(self):
         return f"{self.brand} {self.model} - {self.ram}GB RAM, {self.storage}GB Storage"
@@ -1270,8 +1436,15 @@ class Tablet(models.Model):
     class Meta:
         verbose_name = "Tablet"
         verbose_name_plural = "Tablets"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='tablet_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='tablet_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='tablet_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='tablet_cond_idx'),
+            models.Index(fields=['price'], name='tablet_price_idx'),
+        ]
 
-class Laptop(models.Model):
+class Laptop(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -1280,7 +1453,7 @@ class Laptop(models.Model):
     )
 
     # Brand Choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('Dell', 'Dell'),
         ('HP', 'HP'),
         ('Lenovo', 'Lenovo'),
@@ -1293,17 +1466,17 @@ class Laptop(models.Model):
         ('Microsoft', 'Microsoft'),
         ('Gigabyte', 'Gigabyte'),
         ('Huawei', 'Huawei'),
-    ]
+    )
     brand = models.CharField(max_length=50, choices=BRAND_CHOICES)
     model_name = models.CharField(max_length=100)
     
     # Processor Details
-    PROCESSOR_BRAND_CHOICES = [
+    PROCESSOR_BRAND_CHOICES = (
         ('Intel', 'Intel'),
         ('AMD', 'AMD'),
         ('Apple', 'Apple'),
         ('Qualcomm', 'Qualcomm'),
-    ]
+    )
     processor_brand = models.CharField(max_length=50, choices=PROCESSOR_BRAND_CHOICES)
     processor_model = models.CharField(max_length=100)
     processor_generation = models.CharField(max_length=50)
@@ -1312,64 +1485,64 @@ class Laptop(models.Model):
     boost_clock = models.FloatField(help_text="Boost clock speed in GHz")
 
     # Memory & Storage
-    RAM_TYPE_CHOICES = [
+    RAM_TYPE_CHOICES = (
         ('DDR3', 'DDR3'),
         ('DDR4', 'DDR4'),
         ('DDR5', 'DDR5'),
         ('LPDDR4', 'LPDDR4'),
         ('LPDDR4X', 'LPDDR4X'),
         ('LPDDR5', 'LPDDR5'),
-    ]
-    RAM_CAPACITY_CHOICES = [
+    )
+    RAM_CAPACITY_CHOICES = (
         (4, '4GB'),
         (8, '8GB'),
         (16, '16GB'),
         (32, '32GB'),
         (64, '64GB'),
         (128, '128GB'),
-    ]
+    )
     ram_capacity = models.PositiveIntegerField(choices=RAM_CAPACITY_CHOICES)
     ram_type = models.CharField(max_length=20, choices=RAM_TYPE_CHOICES)
     ram_speed = models.PositiveIntegerField(help_text="RAM speed in MHz")
 
-    STORAGE_TYPE_CHOICES = [
+    STORAGE_TYPE_CHOICES = (
         ('HDD', 'HDD'),
         ('SSD', 'SSD'),
         ('NVMe SSD', 'NVMe SSD'),
-    ]
-    STORAGE_CAPACITY_CHOICES = [
+    )
+    STORAGE_CAPACITY_CHOICES = (
         (256, '256GB'),
         (512, '512GB'),
         (1024, '1TB'),
         (2048, '2TB'),
         (4096, '4TB'),
-    ]
+    )
     storage_type = models.CharField(max_length=20, choices=STORAGE_TYPE_CHOICES)
     storage_capacity = models.PositiveIntegerField(choices=STORAGE_CAPACITY_CHOICES)
 
     # Display
-    DISPLAY_TYPE_CHOICES = [
+    DISPLAY_TYPE_CHOICES = (
         ('IPS', 'IPS'),
         ('OLED', 'OLED'),
         ('Mini LED', 'Mini LED'),
         ('TN', 'TN'),
         ('VA', 'VA'),
-    ]
-    RESOLUTION_CHOICES = [
+    )
+    RESOLUTION_CHOICES = (
         ('1366x768', 'HD (1366x768)'),
         ('1920x1080', 'Full HD (1920x1080)'),
         ('2560x1440', 'QHD (2560x1440)'),
         ('3840x2160', '4K UHD (3840x2160)'),
         ('3456x2234', '3.5K (3456x2234)'),
-    ]
-    REFRESH_RATE_CHOICES = [
+    )
+    REFRESH_RATE_CHOICES = (
         (60, '60Hz'),
         (90, '90Hz'),
         (120, '120Hz'),
         (144, '144Hz'),
         (165, '165Hz'),
         (240, '240Hz'),
-    ]
+    )
     screen_size = models.FloatField(help_text="Screen size in inches")
     resolution = models.CharField(max_length=50, choices=RESOLUTION_CHOICES)
     refresh_rate = models.PositiveIntegerField(choices=REFRESH_RATE_CHOICES)
@@ -1378,12 +1551,12 @@ class Laptop(models.Model):
     touch_screen = models.BooleanField(default=False)
 
     # Graphics
-    GPU_BRAND_CHOICES = [
+    GPU_BRAND_CHOICES = (
         ('NVIDIA', 'NVIDIA'),
         ('AMD', 'AMD'),
         ('Intel', 'Intel'),
         ('Apple', 'Apple'),
-    ]
+    )
     gpu_brand = models.CharField(max_length=50, choices=GPU_BRAND_CHOICES)
     gpu_model = models.CharField(max_length=100)
     gpu_memory = models.PositiveIntegerField(help_text="GPU memory in GB")
@@ -1395,17 +1568,17 @@ class Laptop(models.Model):
     fast_charging = models.BooleanField(default=False)
 
     # Connectivity
-    WIFI_STANDARD_CHOICES = [
+    WIFI_STANDARD_CHOICES = (
         ('Wi-Fi 5', 'Wi-Fi 5 (802.11ac)'),
         ('Wi-Fi 6', 'Wi-Fi 6 (802.11ax)'),
         ('Wi-Fi 6E', 'Wi-Fi 6E'),
-    ]
-    BLUETOOTH_VERSION_CHOICES = [
+    )
+    BLUETOOTH_VERSION_CHOICES = (
         ('4.0', 'Bluetooth 4.0'),
         ('5.0', 'Bluetooth 5.0'),
         ('5.1', 'Bluetooth 5.1'),
         ('5.2', 'Bluetooth 5.2'),
-    ]
+    )
     wifi_standard = models.CharField(max_length=20, choices=WIFI_STANDARD_CHOICES)
     bluetooth_version = models.CharField(max_length=20, choices=BLUETOOTH_VERSION_CHOICES)
     usb_ports = models.JSONField(help_text="List of USB ports and their types", blank=True, null=True)
@@ -1415,31 +1588,31 @@ class Laptop(models.Model):
     card_reader = models.BooleanField(default=False)
 
     # Physical Specifications
-    COLOR_CHOICES = [
+    COLOR_CHOICES = (
         ('Black', 'Black'),
         ('Silver', 'Silver'),
         ('Space Gray', 'Space Gray'),
         ('White', 'White'),
         ('Blue', 'Blue'),
         ('Red', 'Red'),
-    ]
-    MATERIAL_CHOICES = [
+    )
+    MATERIAL_CHOICES = (
         ('Aluminum', 'Aluminum'),
         ('Plastic', 'Plastic'),
         ('Magnesium', 'Magnesium'),
         ('Carbon Fiber', 'Carbon Fiber'),
-    ]
+    )
     weight = models.FloatField(help_text="Weight in kg")
     dimensions = models.CharField(max_length=50, help_text="WxDxH in mm")
     build_material = models.CharField(max_length=100, choices=MATERIAL_CHOICES)
     color = models.CharField(max_length=50, choices=COLOR_CHOICES)
 
     # Features
-    WEBCAM_RESOLUTION_CHOICES = [
+    WEBCAM_RESOLUTION_CHOICES = (
         ('720p', 'HD (720p)'),
         ('1080p', 'Full HD (1080p)'),
         ('1440p', 'QHD (1440p)'),
-    ]
+    )
     backlit_keyboard = models.BooleanField(default=False)
     fingerprint_sensor = models.BooleanField(default=False)
     numeric_keypad = models.BooleanField(default=False)
@@ -1448,13 +1621,13 @@ class Laptop(models.Model):
     microphone = models.CharField(max_length=100)
 
     # Operating System
-    OS_CHOICES = [
+    OS_CHOICES = (
         ('Windows 10', 'Windows 10'),
         ('Windows 11', 'Windows 11'),
         ('macOS', 'macOS'),
         ('Linux', 'Linux'),
         ('ChromeOS', 'ChromeOS'),
-    ]
+    )
     operating_system = models.CharField(max_length=50, choices=OS_CHOICES)
     os_version = models.CharField(max_length=50)
 
@@ -1464,26 +1637,11 @@ class Laptop(models.Model):
     # Standard Fields (unchanged)
     condition = models.CharField(
         max_length=20,
-        choices=[
-            ('new', 'New'),
-            ('used', 'Used'),
-            ('refurbished', 'Refurbished'),
-            ('box_open', 'Box Open'),
-        ]
+        choices=CONDITION_CHOICES
     )
     warranty = models.CharField(
         max_length=20,
-        choices=[
-            ('no_warranty', 'No Warranty'),
-            ('1_day', '1 Day'),
-            ('3_days', '3 Days'),
-            ('1_week', '1 Week'),
-            ('1_month', '1 Month'),
-            ('6_months', '6 Months'),
-            ('1_year', '1 Year'),
-            ('2_years', '2 Years'),
-            ('3_years', '3 Years'),
-        ],
+        choices=WARRANTY_CHOICES,
         blank=True
     )
     top_pick = models.BooleanField(default=False)
@@ -1494,7 +1652,6 @@ class Laptop(models.Model):
         blank=True
     )
     
-    images = GenericRelation(ProductImage)
     sku = models.CharField(max_length=20, unique=True, editable=False)
 
     description = models.TextField(
@@ -1503,12 +1660,8 @@ class Laptop(models.Model):
         help_text="Detailed description of the laptop"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base = f"{self.brand[:3]}{self.model_name[:3]}{self.processor_model[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.processor_model[:3]}"
 
     def __str__(self):
         return self.name
@@ -1516,8 +1669,15 @@ class Laptop(models.Model):
     class Meta:
         verbose_name = "Laptop"
         verbose_name_plural = "Laptops"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='laptop_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='laptop_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='laptop_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='laptop_cond_idx'),
+            models.Index(fields=['price'], name='laptop_price_idx'),
+        ]
 
-class StorageDevice(models.Model):
+class StorageDevice(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -1525,7 +1685,7 @@ class StorageDevice(models.Model):
         help_text="The full name of the storage device (e.g., Samsung 970 EVO Plus 1TB NVMe SSD)"
     )
     # Predefined brand choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('Seagate', 'Seagate'),
         ('Western Digital', 'Western Digital'),
         ('Samsung', 'Samsung'),
@@ -1536,17 +1696,17 @@ class StorageDevice(models.Model):
         ('Intel', 'Intel'),
         ('SK Hynix', 'SK Hynix'),
         ('TeamGroup', 'TeamGroup'),
-    ]
+    )
 
     # Storage Type choices
-    STORAGE_TYPE_CHOICES = [
+    STORAGE_TYPE_CHOICES = (
         ('HDD', 'HDD (Hard Disk Drive)'),
         ('SSD', 'SSD (Solid State Drive)'),
         ('NVMe', 'NVMe SSD (PCIe)'),
-    ]
+    )
 
     # Capacity choices
-    CAPACITY_CHOICES = [
+    CAPACITY_CHOICES = (
         (128, '128GB'),
         (256, '256GB'),
         (512, '512GB'),
@@ -1556,23 +1716,23 @@ class StorageDevice(models.Model):
         (8192, '8TB'),
         (12288, '12TB'),
         (16000, '16TB'),
-    ]
+    )
 
     # Interface choices
-    INTERFACE_CHOICES = [
+    INTERFACE_CHOICES = (
         ('SATA', 'SATA'),
         ('PCIe Gen3', 'PCIe Gen3'),
         ('PCIe Gen4', 'PCIe Gen4'),
         ('PCIe Gen5', 'PCIe Gen5'),
-    ]
+    )
 
     # Form Factor choices
-    FORM_FACTOR_CHOICES = [
+    FORM_FACTOR_CHOICES = (
         ('2.5"', '2.5-inch'),
         ('3.5"', '3.5-inch'),
         ('M.2', 'M.2'),
         ('U.2', 'U.2'),
-    ]
+    )
 
     brand = models.CharField(max_length=50, choices=BRAND_CHOICES)
     model_name = models.CharField(max_length=100, help_text="e.g., Barracuda, 970 EVO, WD Black")
@@ -1590,12 +1750,6 @@ class StorageDevice(models.Model):
     tbw = models.PositiveIntegerField(blank=True, null=True, help_text="Total Bytes Written (TBW) for SSD endurance")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -1603,17 +1757,6 @@ class StorageDevice(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -1627,9 +1770,6 @@ class StorageDevice(models.Model):
         help_text="Is this storage device a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -1652,17 +1792,22 @@ class StorageDevice(models.Model):
         help_text="Detailed description of the storage device"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.capacity}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.capacity}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} {self.capacity}GB {self.storage_type} {self.interface}"
 
-class PSU(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='storagedevice_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='storagedevice_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='storagedevice_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='storagedevice_cond_idx'),
+            models.Index(fields=['price'], name='storagedevice_price_idx'),
+        ]
+
+class PSU(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -1670,7 +1815,7 @@ class PSU(models.Model):
         help_text="The full name of the PSU (e.g., Corsair RM850x 850W 80+ Gold)"
     )
     # Predefined brand choices
-    BRAND_CHOICES = [
+    BRAND_CHOICES = (
         ('Corsair', 'Corsair'),
         ('EVGA', 'EVGA'),
         ('Seasonic', 'Seasonic'),
@@ -1683,10 +1828,10 @@ class PSU(models.Model):
         ('Deepcool', 'Deepcool'),
         ('ASUS', 'ASUS'),
         ('MSI', 'MSI'),
-    ]
+    )
 
     # Wattage choices
-    WATTAGE_CHOICES = [
+    WATTAGE_CHOICES = (
         (450, '450W'),
         (550, '550W'),
         (650, '650W'),
@@ -1696,31 +1841,31 @@ class PSU(models.Model):
         (1200, '1200W'),
         (1500, '1500W'),
         (1600, '1600W'),
-    ]
+    )
 
     # Efficiency Rating choices
-    EFFICIENCY_CHOICES = [
+    EFFICIENCY_CHOICES = (
         ('80+ Bronze', '80+ Bronze'),
         ('80+ Silver', '80+ Silver'),
         ('80+ Gold', '80+ Gold'),
         ('80+ Platinum', '80+ Platinum'),
         ('80+ Titanium', '80+ Titanium'),
-    ]
+    )
 
     # Modular type choices
-    MODULAR_CHOICES = [
+    MODULAR_CHOICES = (
         ('Non-Modular', 'Non-Modular'),
         ('Semi-Modular', 'Semi-Modular'),
         ('Fully Modular', 'Fully Modular'),
-    ]
+    )
 
     # Form factor choices
-    FORM_FACTOR_CHOICES = [
+    FORM_FACTOR_CHOICES = (
         ('ATX', 'ATX'),
         ('SFX', 'SFX'),
         ('SFX-L', 'SFX-L'),
         ('TFX', 'TFX'),
-    ]
+    )
 
     brand = models.CharField(max_length=50, choices=BRAND_CHOICES)
     model_name = models.CharField(max_length=100, help_text="e.g., RM850x, SF600, Focus GX-750")
@@ -1744,12 +1889,6 @@ class PSU(models.Model):
     has_otp = models.BooleanField(default=True, help_text="Over Temperature Protection (OTP)")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -1757,17 +1896,6 @@ class PSU(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -1781,9 +1909,6 @@ class PSU(models.Model):
         help_text="Is this PSU a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -1806,17 +1931,22 @@ class PSU(models.Model):
         help_text="Detailed description of the PSU"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.wattage}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.wattage}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} {self.wattage}W {self.efficiency_rating}"
 
-class Monitor(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='psu_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='psu_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='psu_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='psu_cond_idx'),
+            models.Index(fields=['price'], name='psu_price_idx'),
+        ]
+
+class Monitor(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -1824,16 +1954,16 @@ class Monitor(models.Model):
         help_text="The full name of the monitor (e.g., ASUS ROG Swift PG279QM 27\" 1440p 240Hz)"
     )
     # Panel type choices
-    PANEL_TYPE_CHOICES = [
+    PANEL_TYPE_CHOICES = (
         ('IPS', 'IPS'),
         ('VA', 'VA'),
         ('TN', 'TN'),
         ('OLED', 'OLED'),
         ('Mini LED', 'Mini LED'),
-    ]
+    )
 
     # Refresh rate choices
-    REFRESH_RATE_CHOICES = [
+    REFRESH_RATE_CHOICES = (
         (60, '60Hz'),
         (75, '75Hz'),
         (120, '120Hz'),
@@ -1841,23 +1971,23 @@ class Monitor(models.Model):
         (165, '165Hz'),
         (240, '240Hz'),
         (360, '360Hz'),
-    ]
+    )
 
     # Resolution choices
-    RESOLUTION_CHOICES = [
+    RESOLUTION_CHOICES = (
         ('1920x1080', '1080p (1920x1080)'),
         ('2560x1440', '1440p (2560x1440)'),
         ('3840x2160', '4K (3840x2160)'),
         ('5120x2160', '5K (5120x2160)'),
         ('7680x4320', '8K (7680x4320)'),
-    ]
+    )
 
     # Aspect ratio choices
-    ASPECT_RATIO_CHOICES = [
+    ASPECT_RATIO_CHOICES = (
         ('16:9', '16:9 (Standard)'),
         ('21:9', '21:9 (Ultrawide)'),
         ('32:9', '32:9 (Super Ultrawide)'),
-    ]
+    )
 
     brand = models.CharField(max_length=50, help_text="Enter monitor brand (e.g., Dell, ASUS, LG)")
     model_name = models.CharField(max_length=100, help_text="Enter model name (e.g., ROG Swift PG259QN)")
@@ -1878,12 +2008,6 @@ class Monitor(models.Model):
     supports_freesync = models.BooleanField(default=False, help_text="Supports AMD FreeSync?")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -1891,17 +2015,6 @@ class Monitor(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -1924,9 +2037,6 @@ class Monitor(models.Model):
         help_text="The price of the monitor"
     )
 
-    # Images
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -1943,26 +2053,29 @@ class Monitor(models.Model):
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.screen_size}\" {self.resolution} {self.refresh_rate}Hz"
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.screen_size}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.screen_size}"
 
     class Meta:
         verbose_name = "Monitor"
         verbose_name_plural = "Monitors"
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='monitor_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='monitor_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='monitor_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='monitor_cond_idx'),
+            models.Index(fields=['price'], name='monitor_price_idx'),
+        ]
 
 # Mouse Model
-class Mouse(models.Model):
+class Mouse(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
         unique=True, 
         help_text="The full name of the mouse (e.g., Logitech G Pro X Superlight Wireless)"
     )
-    CONNECTION_CHOICES = [("Wired", "Wired"), ("Wireless", "Wireless")]
+    CONNECTION_CHOICES = (("Wired", "Wired"), ("Wireless", "Wireless"))
 
     brand = models.CharField(max_length=50, help_text="Enter the brand (e.g., Logitech, Razer)")
     model_name = models.CharField(max_length=100)
@@ -1972,12 +2085,6 @@ class Mouse(models.Model):
     has_rgb = models.BooleanField(default=False, help_text="RGB lighting?")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -1985,17 +2092,6 @@ class Mouse(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -2009,9 +2105,6 @@ class Mouse(models.Model):
         help_text="Is this mouse a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -2034,26 +2127,31 @@ class Mouse(models.Model):
         help_text="Detailed description of the mouse"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.dpi}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.dpi}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.connection_type}, {self.dpi} DPI"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='mouse_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='mouse_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='mouse_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='mouse_cond_idx'),
+            models.Index(fields=['price'], name='mouse_price_idx'),
+        ]
+
 # Keyboard Model
-class Keyboard(models.Model):
+class Keyboard(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
         unique=True, 
         help_text="The full name of the keyboard (e.g., Corsair K70 RGB MK.2 Mechanical Gaming Keyboard)"
     )
-    CONNECTION_CHOICES = [("Wired", "Wired"), ("Wireless", "Wireless")]
-    TYPE_CHOICES = [("Mechanical", "Mechanical"), ("Membrane", "Membrane")]
+    CONNECTION_CHOICES = (("Wired", "Wired"), ("Wireless", "Wireless"))
+    TYPE_CHOICES = (("Mechanical", "Mechanical"), ("Membrane", "Membrane"))
 
     brand = models.CharField(max_length=50, help_text="Enter the brand (e.g., Corsair, ASUS)")
     model_name = models.CharField(max_length=100)
@@ -2063,12 +2161,6 @@ class Keyboard(models.Model):
     num_keys = models.PositiveIntegerField(help_text="Total keys count")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -2076,17 +2168,6 @@ class Keyboard(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -2100,9 +2181,6 @@ class Keyboard(models.Model):
         help_text="Is this keyboard a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -2125,25 +2203,30 @@ class Keyboard(models.Model):
         help_text="Detailed description of the keyboard"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.keyboard_type[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.keyboard_type[:3]}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.keyboard_type}, {self.connection_type}"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='keyboard_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='keyboard_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='keyboard_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='keyboard_cond_idx'),
+            models.Index(fields=['price'], name='keyboard_price_idx'),
+        ]
+
 # Headset Model
-class Headset(models.Model):
+class Headset(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
         unique=True, 
         help_text="The full name of the headset (e.g., HyperX Cloud II Wireless Gaming Headset)"
     )
-    CONNECTION_CHOICES = [("Wired", "Wired"), ("Wireless", "Wireless")]
+    CONNECTION_CHOICES = (("Wired", "Wired"), ("Wireless", "Wireless"))
 
     brand = models.CharField(max_length=50, help_text="Enter the brand (e.g., HyperX, SteelSeries)")
     model_name = models.CharField(max_length=100)
@@ -2152,12 +2235,6 @@ class Headset(models.Model):
     surround_sound = models.BooleanField(default=False, help_text="Virtual Surround Sound?")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -2165,17 +2242,6 @@ class Headset(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -2189,9 +2255,6 @@ class Headset(models.Model):
         help_text="Is this headset a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -2214,25 +2277,30 @@ class Headset(models.Model):
         help_text="Detailed description of the headset"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.connection_type[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.connection_type[:3]}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.connection_type}, Mic: {self.has_microphone}"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='headset_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='headset_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='headset_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='headset_cond_idx'),
+            models.Index(fields=['price'], name='headset_price_idx'),
+        ]
+
 # Speakers Model
-class Speakers(models.Model):
+class Speakers(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
         unique=True, 
         help_text="The full name of the speakers (e.g., Logitech Z623 2.1 Speaker System)"
     )
-    CONNECTION_CHOICES = [("Wired", "Wired"), ("Bluetooth", "Bluetooth")]
+    CONNECTION_CHOICES = (("Wired", "Wired"), ("Bluetooth", "Bluetooth"))
 
     brand = models.CharField(max_length=50, help_text="Enter the brand (e.g., Bose, JBL)")
     model_name = models.CharField(max_length=100)
@@ -2241,12 +2309,6 @@ class Speakers(models.Model):
     has_subwoofer = models.BooleanField(default=False, help_text="Has a subwoofer?")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -2254,17 +2316,6 @@ class Speakers(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -2278,9 +2329,6 @@ class Speakers(models.Model):
         help_text="Is this speaker set a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -2303,18 +2351,23 @@ class Speakers(models.Model):
         help_text="Detailed description of the speakers"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.wattage}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.wattage}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.connection_type}, {self.wattage}W"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='speakers_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='speakers_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='speakers_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='speakers_cond_idx'),
+            models.Index(fields=['price'], name='speakers_price_idx'),
+        ]
+
 # Other Accessories Model
-class OtherAccessory(models.Model):
+class OtherAccessory(BaseProduct):
     # Basic Information
     name = models.CharField(
         max_length=255, 
@@ -2326,12 +2379,6 @@ class OtherAccessory(models.Model):
     category = models.CharField(max_length=100, help_text="Category (e.g., Cooling Pad, USB Hub)")
 
     # Condition (Choices)
-    CONDITION_CHOICES = [
-        ('new', 'New'),
-        ('used', 'Used'),
-        ('refurbished', 'Refurbished'),
-        ('box_open', 'Box Open'),
-    ]
     condition = models.CharField(
         max_length=20, 
         choices=CONDITION_CHOICES, 
@@ -2339,17 +2386,6 @@ class OtherAccessory(models.Model):
     )
     
     # Warranty (Choices)
-    WARRANTY_CHOICES = [
-        ('no_warranty', 'No Warranty'),
-        ('1_day', '1 Day'),
-        ('3_days', '3 Days'),
-        ('1_week', '1 Week'),
-        ('1_month', '1 Month'),
-        ('6_months', '6 Months'),
-        ('1_year', '1 Year'),
-        ('2_years', '2 Years'),
-        ('3_years', '3 Years'),
-    ]
     warranty = models.CharField(
         max_length=20, 
         choices=WARRANTY_CHOICES, 
@@ -2363,9 +2399,6 @@ class OtherAccessory(models.Model):
         help_text="Is this accessory a top pick?"
     )
 
-    # Images (Required)
-    images = GenericRelation(ProductImage)
-
     # SKU (Automatically Generated)
     sku = models.CharField(
         max_length=20, 
@@ -2388,16 +2421,64 @@ class OtherAccessory(models.Model):
         help_text="Detailed description of the accessory"
     )
 
-    def save(self, *args, **kwargs):
-        if not self.sku:
-            base_number = f"{self.brand[:3]}{self.model_name[:3]}{self.category[:3]}"
-            unique_id = str(uuid.uuid4().int)[:6]
-            self.sku = f"{base_number}{unique_id}"
-        super().save(*args, **kwargs)
+    def sku_base(self):
+        return f"{self.brand[:3]}{self.model_name[:3]}{self.category[:3]}"
 
     def __str__(self):
         return f"{self.brand} {self.model_name} - {self.category}"        
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['brand', 'top_pick'], name='otheraccessory_brand_pick_idx'),
+            models.Index(fields=['top_pick', 'price'], name='otheraccessory_pick_price_idx'),
+            models.Index(fields=['brand', 'condition', 'price'], name='otheraccessory_brand_cond_idx'),
+            models.Index(fields=['condition', 'price'], name='otheraccessory_cond_idx'),
+            models.Index(fields=['price'], name='otheraccessory_price_idx'),
+        ]
+
+# Columns each product's __str__ needs, so ProductImage.objects.with_targets()
+# can load narrow rows without triggering deferred-field queries
+IMAGE_TARGET_FIELDS = {
+    GPU: ('name',),
+    CPU: ('name',),
+    Case: ('brand', 'name', 'model'),
+    RAM: ('brand', 'model_name', 'capacity', 'ram_type', 'speed'),
+    Motherboard: ('name',),
+    Tablet: ('brand', 'model', 'ram', 'storage'),
+    Laptop: ('name',),
+    StorageDevice: ('brand', 'model_name', 'capacity', 'storage_type', 'interface'),
+    PSU: ('brand', 'model_name', 'wattage', 'efficiency_rating'),
+    Monitor: ('brand', 'model_name', 'screen_size', 'resolution', 'refresh_rate'),
+    Mouse: ('brand', 'model_name', 'connection_type', 'dpi'),
+    Keyboard: ('brand', 'model_name', 'keyboard_type', 'connection_type'),
+    Headset: ('brand', 'model_name', 'connection_type', 'has_microphone'),
+    Speakers: ('brand', 'model_name', 'connection_type', 'wattage'),
+    OtherAccessory: ('brand', 'model_name', 'category'),
+}
+
+PRODUCT_MODELS = tuple(IMAGE_TARGET_FIELDS)
+
+# (context name, model) pairs for the per-category product counts
+CATEGORY_COUNTS = (
+    ('gpu_count', GPU), ('cpu_count', CPU), ('ram_count', RAM), ('motherboard_count', Motherboard),
+    ('case_count', Case), ('storage_count', StorageDevice), ('psu_count', PSU), ('monitor_count', Monitor),
+    ('tablet_count', Tablet), ('laptop_count', Laptop), ('mouse_count', Mouse), ('keyboard_count', Keyboard),
+    ('headset_count', Headset), ('speakers_count', Speakers), ('other_accessory_count', OtherAccessory),
+)
+
+def count_categories():
+    """Count every category's products in a single UNION ALL query"""
+    arms = [
+        model.objects.order_by().annotate(model_index=Value(index))
+        .values('model_index').annotate(total=Count('pk')).values_list('model_index', 'total')
+        for index, (name, model) in enumerate(CATEGORY_COUNTS)
+    ]
+    return {CATEGORY_COUNTS[index][0]: total for index, total in arms[0].union(*arms[1:], all=True)}
+
+def cached_category_counts():
+    """Product count per category, cached until the next catalog write"""
+    return cache.get_or_set(catalog_cache_key('category_counts'), count_categories, 3600)
+
 class ComparisonList(models.Model):
     """Model to store comparison lists for users"""
     user = models.ForeignKey(
@@ -2418,11 +2499,28 @@ class ComparisonList(models.Model):
     class Meta:
         verbose_name = "Comparison List"
         verbose_name_plural = "Comparison Lists"
+        indexes = [
+            # Lists are looked up by owner and type
+            models.Index(fields=['user', 'product_type'], name='cmplist_user_type_idx'),
+            models.Index(fields=['session_key', 'product_type'], name='cmplist_session_type_idx'),
+        ]
     
     def __str__(self):
         owner = self.user.username if self.user else f"Session {self.session_key[:8]}"
         return f"{self.product_type} Comparison by {owner}"
 
+class SavedProductQuerySet(models.QuerySet):
+    def with_products(self, listing=False):
+        """Load the items' products, and their images, with one query per product type; listing reads only LISTING_FIELDS"""
+        querysets = [model.objects.with_images() for model in PRODUCT_MODELS]
+        if listing:
+            querysets = [queryset.for_listing() for queryset in querysets]
+        return self.prefetch_related(GenericPrefetch('product', querysets))
+
+class SavedProductManager(models.Manager.from_queryset(SavedProductQuerySet)):
+    def get_queryset(self):
+        # Views read item.content_type to find the product model
+        return super().get_queryset().select_related('content_type')
 
 class ComparisonItem(models.Model):
     """Individual items in a comparison list"""
@@ -2435,11 +2533,23 @@ class ComparisonItem(models.Model):
     object_id = models.PositiveIntegerField()
     product = GenericForeignKey('content_type', 'object_id')
     added_at = models.DateTimeField(auto_now_add=True)
+
+    objects = SavedProductManager()
     
     class Meta:
         verbose_name = "Comparison Item"
         verbose_name_plural = "Comparison Items"
         ordering = ['added_at']
+        indexes = [
+            models.Index(fields=['comparison_list', 'added_at'], name='cmpitem_list_added_idx'),
+        ]
+        constraints = [
+            # Also the index behind the "already in this comparison?" lookup
+            models.UniqueConstraint(
+                fields=['comparison_list', 'content_type', 'object_id'],
+                name='cmpitem_unique_target',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.product} in {self.comparison_list}"
@@ -2459,11 +2569,22 @@ class WishlistItem(models.Model):
     object_id = models.PositiveIntegerField()
     product = GenericForeignKey('content_type', 'object_id')
     added_at = models.DateTimeField(auto_now_add=True)
+
+    objects = SavedProductManager()
     
     class Meta:
         verbose_name = "Wishlist Item"
         verbose_name_plural = "Wishlist Items"
         ordering = ['-added_at']
+        indexes = [
+            models.Index(fields=['user', '-added_at'], name='wish_user_added_idx'),
+            models.Index(fields=['session_key', '-added_at'], name='wish_session_added_idx'),
+        ]
+        constraints = [
+            # One row per product and owner; the unused owner column is NULL and never collides
+            models.UniqueConstraint(fields=['user', 'content_type', 'object_id'], name='wish_unique_user_target'),
+            models.UniqueConstraint(fields=['session_key', 'content_type', 'object_id'], name='wish_unique_session_target'),
+        ]
     
     def __str__(self):
         owner = self.user.username if self.user else f"Session {self.session_key[:8]}"
@@ -2473,6 +2594,9 @@ class WishlistItem(models.Model):
 
 class Slider(models.Model):
     """Model for homepage slider images and content"""
+    # Cache key for the active slides shown on the home page
+    CACHE_KEY = 'active_sliders'
+
     title = models.CharField(max_length=100, help_text="Internal title for this slide (not displayed)")
     heading = models.CharField(max_length=100, help_text="Main heading displayed on the slide")
     subheading = models.CharField(max_length=200, blank=True, help_text="Optional subheading displayed below the main heading")
@@ -2494,6 +2618,9 @@ class Slider(models.Model):
         ordering = ['order', 'id']
         verbose_name = "Slider"
         verbose_name_plural = "Sliders"
+        indexes = [
+            models.Index(fields=['is_active', 'order', 'id'], name='slider_active_order_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -2509,7 +2636,15 @@ class ContactMessage(models.Model):
     def __str__(self):
         return f"{self.name} - {self.subject} ({self.email})"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-submitted_at', 'is_read'], name='cm_submitted_read_idx'),
+        ]
+
 class SiteNumber(models.Model):
+    # Cache key for whether a row exists at all (used by the admin)
+    EXISTS_CACHE_KEY = 'sitenumber_exists'
+
     number = models.CharField(max_length=32, help_text="Primary contact number to display site-wide.")
 
     def __str__(self):
@@ -0,0 +1,23 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import PRODUCT_MODELS, ProductImage, SiteNumber, Slider, bump_catalog_version
+
+@receiver([post_save, post_delete], sender=SiteNumber)
+def clear_site_number_cache(sender, **kwargs):
+    """Drop the admin's cached existence flag whenever a number is added or removed"""
+    cache.delete(SiteNumber.EXISTS_CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Slider)
+def clear_slider_cache(sender, **kwargs):
+    """Drop the cached home page slides whenever one is edited or removed"""
+    cache.delete(Slider.CACHE_KEY)
+
+def invalidate_catalog_cache(sender, **kwargs):
+    """Expire cached listings once the product or image write has committed"""
+    transaction.on_commit(bump_catalog_version)
+
+for model in (*PRODUCT_MODELS, ProductImage):
+    post_save.connect(invalidate_catalog_cache, sender=model)
+    post_delete.connect(invalidate_catalog_cache, sender=model)
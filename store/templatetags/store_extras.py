@@ -9,21 +9,18 @@ def get_item(dictionary, key):
     """Get an item from a dictionary using a variable key"""
     return dictionary.get(key)
 
-@register.filter
-def get_attr(obj, attr):
-    """Get an attribute from an object using a variable attribute name"""
-    try:
-        return getattr(obj, attr)
-    except (AttributeError, TypeError):
-        return None
-
 @register.filter
 def getattribute(obj, attr):
     """Get an attribute from an object using a variable attribute name"""
-    try:
-        return getattr(obj, attr)
-    except (AttributeError, TypeError):
-        return None
+    return getattr(obj, attr, None)
+
+# Older templates use the shorter name
+register.filter('get_attr', getattribute)
+
+@register.simple_tag
+def product_image(image, **kwargs):
+    """Render a ProductImage via render_tag, e.g. {% product_image image lcp=forloop.first class="primary" %}"""
+    return image.render_tag(**kwargs)
 
 @register.filter
 def jsonify(value):
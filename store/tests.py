@@ -1,3 +1,265 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
+from PIL import Image
+from django.contrib.auth.models import User
+from django.contrib.messages import INFO, get_messages
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import models
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import isolate_apps
+from django.urls import reverse
+from .models import (
+    CATALOG_VERSION_KEY, GPU, ComparisonItem, ProductImage, SkuMixin, SkuSequence, WishlistItem,
+    bump_catalog_version, catalog_cache_key, reserve_sku_numbers,
+)
+from .views import keyset_page
 
-# Create your tests here.
+
+def make_gpu(**kwargs):
+    """Saved GPU with only the required fields filled in"""
+    fields = {'brand': 'nvidia', 'model': 'RTX', 'vram': 8, 'condition': 'new', 'price': 100}
+    fields.update(kwargs)
+    fields.setdefault('name', f"GPU {GPU.objects.count()}")
+    return GPU.objects.create(**fields)
+
+
+# Keep test runs out of the shared on-disk cache
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CatalogTestCase(TestCase):
+    def setUp(self):
+        # TestCase never runs on_commit, so writes here don't bump the catalog version
+        cache.clear()
+
+
+class ProductListFilterTests(CatalogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.gpu = make_gpu(brand='nvidia', memory_type='gddr6', condition='used')
+        make_gpu(brand='amd', memory_type='gddr5')
+
+    def listed(self, **params):
+        response = self.client.get(reverse('product_list', args=['gpu']), params)
+        return [product.pk for product in response.context['products']]
+
+    def test_filters_ignore_case(self):
+        # The navbar links use their own casing, e.g. ?brand=dell for 'Dell'
+        self.assertEqual(self.listed(brand='NVIDIA'), [self.gpu.pk])
+        self.assertEqual(self.listed(memory_type='GDDR6'), [self.gpu.pk])
+        self.assertEqual(self.listed(condition='Used'), [self.gpu.pk])
+
+
+class CatalogCacheKeyTests(CatalogTestCase):
+    def version(self):
+        return int(catalog_cache_key('x').split(':')[1])
+
+    def test_bump_changes_key(self):
+        before = self.version()
+        bump_catalog_version()
+        self.assertGreater(self.version(), before)
+
+    def test_lost_version_does_not_restart_low(self):
+        # Keys built from an evicted version may still be cached and must not come back
+        before = self.version()
+        cache.delete(CATALOG_VERSION_KEY)
+        self.assertGreater(self.version(), before)
+        cache.delete(CATALOG_VERSION_KEY)
+        bump_catalog_version()
+        self.assertGreater(self.version(), before)
+
+
+def png_upload(size=600, color='red'):
+    """Square PNG upload of a single colour"""
+    buffer = BytesIO()
+    Image.new('RGB', (size, size), color).save(buffer, format='PNG')
+    return SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png')
+
+
+class ProductImageVariantTests(CatalogTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(self.settings(MEDIA_ROOT=media_root))
+
+    def add_image(self, product, **kwargs):
+        image = ProductImage.for_object(product, image=png_upload(**kwargs), alt_text='photo')
+        image.save()
+        return image
+
+    def test_variants_skip_widths_above_the_source(self):
+        image = self.add_image(make_gpu(), size=600)
+        self.assertEqual(sorted(image.variants, key=int), ['256', '512'])
+        for name in image.variants.values():
+            self.assertTrue(image.image.storage.exists(name))
+
+    def test_duplicate_uploads_share_variants(self):
+        first = self.add_image(make_gpu())
+        storage = first.image.storage
+        written = {name: storage.get_modified_time(name) for name in first.variants.values()}
+        second = self.add_image(make_gpu())
+        self.assertEqual(second.image.name, first.image.name)
+        self.assertEqual(second.variants, first.variants)
+        self.assertEqual({name: storage.get_modified_time(name) for name in written}, written)
+
+    def test_srcset_orders_widths_numerically(self):
+        image = self.add_image(make_gpu(), size=1100)
+        widths = [candidate.split()[-1] for candidate in image.srcset().split(', ')]
+        self.assertEqual(widths, ['256w', '512w', '1024w', '1100w'])
+
+    def test_different_content_gets_its_own_variants(self):
+        first = self.add_image(make_gpu(), color='red')
+        second = self.add_image(make_gpu(), color='blue')
+        self.assertNotEqual(first.variants['256'], second.variants['256'])
+
+
+class ListingImageTests(CatalogTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(self.settings(MEDIA_ROOT=media_root))
+        for color in ('red', 'blue', 'green'):
+            ProductImage.for_object(make_gpu(), image=png_upload(color=color), alt_text=color, is_primary=True).save()
+
+    def test_only_the_first_card_is_eager(self):
+        response = self.client.get(reverse('product_list', args=['gpu']))
+        self.assertContains(response, 'fetchpriority="high"', count=1)
+        # Each card has a primary and a hover image
+        self.assertContains(response, 'loading="lazy"', count=5)
+        self.assertContains(response, 'width="600" height="600"', count=6)
+
+    def test_cards_offer_the_variants(self):
+        response = self.client.get(reverse('product_list', args=['gpu']))
+        self.assertContains(response, '/256.webp 256w', count=6)
+        self.assertContains(response, 'sizes="(min-width: 992px) 25vw', count=6)
+
+
+class SkuSequenceTests(TestCase):
+    def test_reservations_are_consecutive(self):
+        first = reserve_sku_numbers(3)
+        second = reserve_sku_numbers()
+        self.assertEqual(len(first), 3)
+        self.assertEqual(list(second), [first[-1] + 1])
+
+    def test_products_get_distinct_skus(self):
+        skus = {make_gpu().sku for _ in range(3)}
+        bulk = GPU.objects.bulk_create_with_sku([
+            GPU(name=f'Bulk {n}', brand='amd', model='RX', vram=8, condition='new') for n in range(3)
+        ])
+        skus.update(gpu.sku for gpu in bulk)
+        self.assertEqual(len(skus), 6)
+
+    def test_missing_counter_row_is_recreated(self):
+        # e.g. after manage.py flush, which empties the row the migration seeded
+        SkuSequence.objects.all().delete()
+        self.assertEqual(list(reserve_sku_numbers(2)), [1, 2])
+        self.assertTrue(make_gpu().sku)
+        self.assertEqual(SkuSequence.objects.count(), 1)
+
+
+@isolate_apps('store')
+class SkuMixinCheckTests(SimpleTestCase):
+    def test_model_without_sku_base_fails_the_check(self):
+        class Gadget(SkuMixin):
+            sku = models.CharField(max_length=20)
+
+        self.assertEqual([error.id for error in Gadget.check()], ['store.E001'])
+
+    def test_model_with_sku_base_passes(self):
+        class Gadget(SkuMixin):
+            sku = models.CharField(max_length=20)
+
+            def sku_base(self):
+                return 'GAD'
+
+        self.assertEqual(Gadget.check(), [])
+
+
+class KeysetPageTests(TestCase):
+    def setUp(self):
+        prices = [100, 100, None, 50, 100, None, 200]
+        # Names are unique, so ties under the case-insensitive sort differ only in case
+        names = ['b', 'A', 'a', 'C', 'B', 'd', 'c']
+        self.gpus = [make_gpu(name=name, price=price) for name, price in zip(names, prices)]
+
+    def walk(self, sort_by, size=2):
+        """Pks of every page in order, following the cursor to the end"""
+        pks, cursor = [], None
+        while True:
+            page, cursor = keyset_page(GPU.objects.all(), sort_by, cursor, size)
+            pks += [gpu.pk for gpu in page]
+            if cursor is None:
+                return pks
+
+    def expected(self, key, reverse=False):
+        """Pks sorted by key with ties by id in the same direction and missing keys last"""
+        present = [gpu for gpu in self.gpus if key(gpu) is not None]
+        missing = [gpu for gpu in self.gpus if key(gpu) is None]
+        ordered = sorted(present, key=lambda gpu: (key(gpu), gpu.pk), reverse=reverse)
+        return [gpu.pk for gpu in ordered + sorted(missing, key=lambda gpu: gpu.pk, reverse=reverse)]
+
+    def test_price_ties_span_pages(self):
+        price = lambda gpu: gpu.price
+        self.assertEqual(self.walk('price_low'), self.expected(price))
+        self.assertEqual(self.walk('price_high'), self.expected(price, reverse=True))
+
+    def test_missing_prices_come_last_both_ways(self):
+        unpriced = {gpu.pk for gpu in self.gpus if gpu.price is None}
+        for sort_by in ('price_low', 'price_high'):
+            # Page size 1 puts the cursor itself on an unpriced product
+            self.assertEqual(set(self.walk(sort_by, size=1)[-2:]), unpriced)
+
+    def test_name_sort_ignores_case(self):
+        name = lambda gpu: gpu.name.lower()
+        self.assertEqual(self.walk('name_asc'), self.expected(name))
+        self.assertEqual(self.walk('name_desc'), self.expected(name, reverse=True))
+
+    def next_page_after_change(self, sort_by, change):
+        """Pks of page two after change is applied to the last product of page one"""
+        first, cursor = keyset_page(GPU.objects.all(), sort_by, None, 2)
+        change(GPU.objects.filter(pk=first[-1].pk))
+        second, _ = keyset_page(GPU.objects.all(), sort_by, cursor, 2)
+        return [gpu.pk for gpu in second]
+
+    def test_deleted_cursor_row_keeps_its_place(self):
+        unseen = self.expected(lambda gpu: gpu.price)[2:4]
+        self.assertEqual(self.next_page_after_change('price_low', lambda rows: rows.delete()), unseen)
+
+    def test_repriced_cursor_row_keeps_its_place(self):
+        # Dropping to 1 moves it behind page two's rows, not ahead of them
+        unseen = self.expected(lambda gpu: gpu.price, reverse=True)[2:4]
+        self.assertEqual(self.next_page_after_change('price_high', lambda rows: rows.update(price=1)), unseen)
+
+    def test_malformed_cursor_starts_over(self):
+        first, _ = keyset_page(GPU.objects.all(), 'price_low', None)
+        for cursor in ('abc', '3:abc', '3:'):
+            page, _ = keyset_page(GPU.objects.all(), 'price_low', cursor)
+            self.assertEqual(page, first)
+
+
+class RepeatAddTests(TestCase):
+    def setUp(self):
+        self.gpu = make_gpu()
+
+    def add_twice(self, url_name):
+        """Add the GPU twice and return the levels of the messages left by the second add"""
+        url = reverse(url_name, args=[self.gpu.sku])
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 302)
+        return [message.level for message in get_messages(response.wsgi_request)]
+
+    def test_wishlist_keeps_one_item_per_session(self):
+        self.assertIn(INFO, self.add_twice('add_to_wishlist'))
+        self.assertEqual(WishlistItem.objects.count(), 1)
+
+    def test_wishlist_keeps_one_item_per_user(self):
+        self.client.force_login(User.objects.create_user('shopper'))
+        self.assertIn(INFO, self.add_twice('add_to_wishlist'))
+        self.assertEqual(WishlistItem.objects.filter(user__username='shopper').count(), 1)
+
+    def test_comparison_keeps_one_item(self):
+        self.assertIn(INFO, self.add_twice('add_to_comparison'))
+        self.assertEqual(ComparisonItem.objects.count(), 1)
@@ -1,69 +1,160 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.db.models import Q
+from django.db.models import F, Prefetch, Q, Value
+from django.db.models.functions import Lower
+from functools import lru_cache
 from itertools import chain
-from operator import attrgetter
+from operator import itemgetter
+import random
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.core.exceptions import ValidationError
 from django.contrib.contenttypes.models import ContentType
-from django.http import JsonResponse
-from .models import GPU, CPU, RAM, Motherboard, Case, StorageDevice, PSU, Monitor, Tablet, Laptop, ComparisonList, ComparisonItem, WishlistItem, Slider, Mouse, Keyboard, Headset, Speakers, OtherAccessory
-from django.db import models
+from django.http import HttpResponse, JsonResponse
+from django.template.loader import render_to_string
+from django.core.cache import cache
+from .models import cached_category_counts, catalog_cache_key, LISTING_FIELDS, CONDITION_DISPLAY, WARRANTY_DISPLAY, GPU, CPU, RAM, Motherboard, Case, StorageDevice, PSU, Monitor, Tablet, Laptop, ComparisonList, ComparisonItem, WishlistItem, Slider, Mouse, Keyboard, Headset, Speakers, OtherAccessory, ProductImage
+from django.db import models, transaction, IntegrityError
 from .forms import SubscriberForm, ContactForm
 
+# (model, cap) pairs feeding the home page's latest arrivals
+LATEST_ARRIVALS = (
+    (GPU, 6), (CPU, 5), (RAM, 5), (Motherboard, 5), (Case, 5),
+    (StorageDevice, 5), (PSU, 5), (Monitor, 5), (Tablet, 5), (Laptop, 5),
+)
+LISTING_COLUMNS = tuple(GPU._meta.get_field(name).attname for name in LISTING_FIELDS)
+
+@lru_cache(maxsize=None)
+def listing_columns_for(model):
+    """LISTING_COLUMNS in model's own field order, as from_db expects, with their row positions"""
+    columns = tuple(f.attname for f in model._meta.concrete_fields if f.attname in LISTING_COLUMNS)
+    return columns, tuple(LISTING_COLUMNS.index(column) for column in columns)
+
+def listing_instances(models, rows):
+    """Build listing-only instances from UNION rows of LISTING_COLUMNS ending in an index into models"""
+    products = []
+    for row in rows:
+        model = models[row[-1]]
+        columns, positions = listing_columns_for(model)
+        products.append(model.from_db(model.objects.db, columns, [row[i] for i in positions]))
+    return products
+
+def latest_arrivals(limit=20):
+    """Newest products across LATEST_ARRIVALS as listing-only instances, in one query"""
+    # SQLite can't LIMIT inside a UNION arm, so each cap goes in a pk__in subquery
+    arms = [
+        model.objects.filter(pk__in=model.objects.order_by('-id').values('pk')[:cap])
+        .annotate(model_index=Value(index)).values_list(*LISTING_COLUMNS, 'model_index')
+        for index, (model, cap) in enumerate(LATEST_ARRIVALS)
+    ]
+    rows = arms[0].union(*arms[1:], all=True).order_by('-id')[:limit]
+    return listing_instances([model for model, cap in LATEST_ARRIVALS], rows)
+
+def home_products():
+    """Top picks and latest arrivals shown on the home page"""
+    # Get the last 10 top picks for each category
+    top_gpus = GPU.objects.for_listing().filter(top_pick=True).order_by('-id')[:10]
+    top_laptops = Laptop.objects.for_listing().filter(top_pick=True).order_by('-id')[:10]
+    top_tablets = Tablet.objects.for_listing().filter(top_pick=True).order_by('-id')[:10]
+    top_cases = Case.objects.for_listing().filter(top_pick=True).order_by('-id')[:10]
+    
+    latest_products = latest_arrivals()
+    
+    # Lists rather than querysets so the prefetched rows are what gets cached
+    products = {
+        'top_gpus': list(top_gpus),
+        'top_laptops': list(top_laptops),
+        'top_tablets': list(top_tablets),
+        'top_cases': list(top_cases),
+        'latest_products': latest_products,
+    }
+    # One image query for every card instead of one per queryset; the cards
+    # only show the first image and the hover image
+    ProductImage.prefetch_for(chain.from_iterable(products.values()), limit=2)
+    return products
+
 def home(request):
     """
     Home page view that displays top picks and latest arrivals
     """
     # Get active sliders ordered by their display order
-    sliders = Slider.objects.filter(is_active=True).order_by('order')
-    
-    # Get the last 10 top picks for each category
-    top_gpus = GPU.objects.filter(top_pick=True).order_by('-id')[:10]
-    top_laptops = Laptop.objects.filter(top_pick=True).order_by('-id')[:10]
-    top_tablets = Tablet.objects.filter(top_pick=True).order_by('-id')[:10]
-    top_cases = Case.objects.filter(top_pick=True).order_by('-id')[:10]
-    
-    # Get latest arrivals (10 most recent products across selected categories)
-    latest_gpus = GPU.objects.all().order_by('-id')[:6]
-    latest_cpus = CPU.objects.all().order_by('-id')[:5]
-    latest_rams = RAM.objects.all().order_by('-id')[:5]
-    latest_motherboards = Motherboard.objects.all().order_by('-id')[:5]
-    latest_cases = Case.objects.all().order_by('-id')[:5]
-    latest_storage = StorageDevice.objects.all().order_by('-id')[:5]
-    latest_psus = PSU.objects.all().order_by('-id')[:5]
-    latest_monitors = Monitor.objects.all().order_by('-id')[:5]
-    latest_tablets = Tablet.objects.all().order_by('-id')[:5]
-    latest_laptops = Laptop.objects.all().order_by('-id')[:5]
-    
-    # Combine all latest products
-    latest_products = sorted(
-        chain(
-            latest_gpus, latest_cpus, latest_rams, latest_motherboards,
-            latest_cases, latest_storage, latest_psus, latest_monitors,
-            latest_tablets, latest_laptops
-        ),
-        key=attrgetter('id'),
-        reverse=True
-    )[:20]  # Get the 20 most recent products overall
+    sliders = cache.get_or_set(
+        Slider.CACHE_KEY,
+        lambda: list(Slider.objects.filter(is_active=True).order_by('order')),
+        3600
+    )
     
     # Create context dictionary with all data
     context = {
         'sliders': sliders,
-        'top_gpus': top_gpus,
-        'top_laptops': top_laptops,
-        'top_tablets': top_tablets,
-        'top_cases': top_cases,
-        'latest_products': latest_products,
+        **cache.get_or_set(catalog_cache_key('home'), home_products, 300),
         'title': 'Home - Top PC Components and Devices'
     }
     
     return render(request, 'home/home.html', context)
 
+PAGE_SIZE = 24
+
+# sort_by -> (sort key, descending); ties and the default "newest" order by id
+LISTING_SORTS = {
+    'price_low': (F('price'), False),
+    'price_high': (F('price'), True),
+    'name_asc': (Lower('name'), False),
+    'name_desc': (Lower('name'), True),
+}
+
+def keyset_page(queryset, sort_by, cursor, size=PAGE_SIZE):
+    """Return (page, next cursor) for queryset in sort_by order, starting after the cursor's position"""
+    key, descending = LISTING_SORTS.get(sort_by, (None, True))
+    id_order = '-id' if descending else 'id'
+    if key is None:
+        queryset = queryset.order_by(id_order)
+    else:
+        # Missing prices sort last either way
+        sort_key = F('sort_key')
+        queryset = queryset.annotate(sort_key=key).order_by(
+            sort_key.desc(nulls_last=True) if descending else sort_key.asc(nulls_last=True), id_order
+        )
+    # The cursor is "<id>:<sort value>", or the bare id when there is no value, so
+    # it stays valid after the row it came from is edited or deleted
+    pk, has_value, value = (cursor or '').partition(':')
+    try:
+        pk = int(pk)
+        if key is None:
+            queryset = queryset.filter(id__lt=pk)
+        else:
+            after_id = Q(id__lt=pk) if descending else Q(id__gt=pk)
+            if not has_value:
+                queryset = queryset.filter(after_id, sort_key__isnull=True)
+            else:
+                beyond = Q(sort_key__lt=value) if descending else Q(sort_key__gt=value)
+                queryset = queryset.filter(beyond | Q(sort_key=value) & after_id | Q(sort_key__isnull=True))
+    except (ValueError, ValidationError):
+        pass
+    page = list(queryset[:size + 1])
+    next_cursor = None
+    if len(page) > size:
+        last = page[size - 1]
+        value = getattr(last, 'sort_key', None)
+        next_cursor = str(last.pk) if value is None else f'{last.pk}:{value}'
+    return page[:size], next_cursor
+
+def laptop_filter_options():
+    """Dropdown values and price range for the laptop filters"""
+    return {
+        'all_brands': list(Laptop.objects.values_list('brand', flat=True).distinct()),
+        'all_processors': list(Laptop.objects.values_list('processor_brand', flat=True).distinct()),
+        'price_range': Laptop.objects.aggregate(
+            min_price=models.Min('price'),
+            max_price=models.Max('price')
+        ),
+    }
+
 def laptops_list(request):
     """
     View to display all laptops with filtering capabilities
     """
     # Start with all laptops
-    laptops = Laptop.objects.all()
+    laptops = Laptop.objects.for_listing().with_images()
     
     # Get filter parameters from request
     brand = request.GET.get('brand')
@@ -80,7 +171,7 @@ def laptops_list(request):
         laptops = laptops.filter(brand__iexact=brand)
     
     if condition:
-        laptops = laptops.filter(condition__iexact=condition)
+        laptops = laptops.filter(condition=condition.lower())
     
     if min_price:
         try:
@@ -109,32 +200,15 @@ def laptops_list(request):
         except (ValueError, TypeError):
             pass
     
-    # Apply sorting
-    if sort_by == 'price_low':
-        laptops = laptops.order_by('price')
-    elif sort_by == 'price_high':
-        laptops = laptops.order_by('-price')
-    elif sort_by == 'name_asc':
-        laptops = laptops.order_by('name')
-    elif sort_by == 'name_desc':
-        laptops = laptops.order_by('-name')
-    else:  # newest
-        laptops = laptops.order_by('-id')
-    
-    # Get unique values for filter dropdowns
-    all_brands = Laptop.objects.values_list('brand', flat=True).distinct()
-    all_processors = Laptop.objects.values_list('processor_brand', flat=True).distinct()
-    
-    # Get min and max prices for price range filter
-    price_range = Laptop.objects.aggregate(
-        min_price=models.Min('price'),
-        max_price=models.Max('price')
-    )
+    # Apply sorting and take one page
+    cursor = request.GET.get('cursor')
+    laptops, next_cursor = keyset_page(laptops, sort_by, cursor)
+    
+    options = cache.get_or_set(catalog_cache_key('laptop_options'), laptop_filter_options, 3600)
     
     context = {
         'laptops': laptops,
-        'all_brands': all_brands,
-        'all_processors': all_processors,
+        **options,
         'current_brand': brand,
         'current_condition': condition,
         'current_processor': processor,
@@ -143,7 +217,8 @@ def laptops_list(request):
         'current_min_price': min_price,
         'current_max_price': max_price,
         'current_sort': sort_by,
-        'price_range': price_range,
+        'current_cursor': cursor,
+        'next_cursor': next_cursor,
         'title': 'Laptops - Browse All Models'
     }
     
@@ -162,43 +237,33 @@ def laptop_detail(request, pk):
     
     return render(request, 'store/laptop_detail.html', context)
 
+# Product types the SKU-addressed views (detail, quick view, compare, wishlist) look in
+SKU_MODELS = (GPU, CPU, RAM, Motherboard, Case, StorageDevice, PSU, Monitor, Tablet, Laptop)
+
+def find_product_by_sku(sku):
+    """Return (product, model_name) for sku, or (None, None) if no product has it"""
+    # One UNION ALL of unique-index lookups instead of a get() per table
+    lookups = [
+        model.objects.filter(sku=sku).annotate(model_index=Value(index)).values_list('pk', 'model_index')
+        for index, model in enumerate(SKU_MODELS)
+    ]
+    match = next(iter(lookups[0].union(*lookups[1:], all=True)[:1]), None)
+    if match is None:
+        return None, None
+    pk, index = match
+    model = SKU_MODELS[index]
+    return model.objects.get(pk=pk), model._meta.model_name
+
 def add_to_comparison(request, product_sku):
     """Add a product to the comparison list using SKU"""
-    # Map model names to their classes
-    model_map = {
-        'gpu': GPU,
-        'cpu': CPU,
-        'ram': RAM,
-        'motherboard': Motherboard,
-        'case': Case,
-        'storagedevice': StorageDevice,
-        'psu': PSU,
-        'monitor': Monitor,
-        'tablet': Tablet,
-        'laptop': Laptop,
-    }
-    
-    # Try to find the product in any of the models by SKU
-    product = None
-    model_name = None
-    content_type = None
-    
-    for model_key, model_class in model_map.items():
-        try:
-            product = model_class.objects.get(sku=product_sku)
-            model_name = model_key
-            content_type = ContentType.objects.get_for_model(model_class)
-            break
-        except model_class.DoesNotExist:
-            continue
+    # Find the product by SKU with one query across the product tables
+    product, model_name = find_product_by_sku(product_sku)
+    content_type = ContentType.objects.get_for_model(product) if product else None
     
     if not product:
         messages.error(request, f"Product with SKU {product_sku} not found.")
         return redirect('home')
     
-    # Print debug information
-    print(f"Found product: {product}, type: {model_name}, content_type: {content_type}")
-    
     # Get comparison lists for the user/session
     if request.user.is_authenticated:
         comparison_lists = ComparisonList.objects.filter(user=request.user)
@@ -210,19 +275,19 @@ def add_to_comparison(request, product_sku):
         comparison_lists = ComparisonList.objects.filter(session_key=session_key)
     
     # Check if there's an existing comparison list with a different product type
-    for existing_list in comparison_lists:
-        if existing_list.product_type != model_name and existing_list.items.exists():
-            # Clear any existing messages first
-            storage = messages.get_messages(request)
-            for message in storage:
-                pass  # This consumes the messages
-            
-            # Add the new error message
-            messages.error(
-                request, 
-                f"Cannot add {model_name.upper()} to comparison. You already have a {existing_list.product_type.upper()} comparison list. Please clear your existing comparison first."
-            )
-            return redirect('comparison_view')
+    blocking_type = comparison_lists.exclude(product_type=model_name).filter(
+        items__isnull=False
+    ).values_list('product_type', flat=True).first()
+    if blocking_type:
+        # Drop any pending messages without loading them; only the error is shown
+        messages.get_messages(request).used = True
+        
+        # Add the new error message
+        messages.error(
+            request, 
+            f"Cannot add {model_name.upper()} to comparison. You already have a {blocking_type.upper()} comparison list. Please clear your existing comparison first."
+        )
+        return redirect('comparison_view')
     
     # Get or create the appropriate comparison list
     if request.user.is_authenticated:
@@ -236,25 +301,39 @@ def add_to_comparison(request, product_sku):
             product_type=model_name,
         )
     
-    # Check if this product is already in the comparison
-    if ComparisonItem.objects.filter(
-        comparison_list=comparison_list,
-        content_type=content_type,
-        object_id=product.id
-    ).exists():
+    # Add the product to the comparison list; cmpitem_unique_target rejects repeats
+    try:
+        # Savepoint, so a rejected repeat doesn't break an enclosing transaction
+        with transaction.atomic():
+            ComparisonItem.objects.create(
+                comparison_list=comparison_list,
+                content_type=content_type,
+                object_id=product.id
+            )
+    except IntegrityError:
         messages.info(request, f"{product} is already in your comparison list.")
         return redirect('comparison_view')
     
-    # Add the product to the comparison list
-    ComparisonItem.objects.create(
-        comparison_list=comparison_list,
-        content_type=content_type,
-        object_id=product.id
-    )
-    
     messages.success(request, f"{product} ({model_name.upper()}) added to your comparison list.")
     return redirect('comparison_view')
 
+@lru_cache(maxsize=None)
+def compare_fields_for(model_class):
+    """Rows of the comparison table for model_class, excluding the common fields"""
+    exclude_fields = ['id', 'sku', 'name', 'brand', 'price', 'old_price', 
+                     'condition', 'description', 'top_pick', 'created_at', 
+                     'updated_at', 'images']
+    
+    model_fields = []
+    for field in model_class._meta.get_fields():
+        if hasattr(field, 'name') and field.name not in exclude_fields and not field.is_relation:
+            model_fields.append({
+                'name': field.name,
+                'verbose_name': field.verbose_name.title() if hasattr(field, 'verbose_name') else field.name.replace('_', ' ').title(),
+                'field_type': field.get_internal_type()
+            })
+    return tuple(model_fields)
+
 def comparison_view(request):
     """View the comparison list with all model fields"""
     if request.user.is_authenticated:
@@ -265,28 +344,17 @@ def comparison_view(request):
             comparison_lists = ComparisonList.objects.none()
         else:
             comparison_lists = ComparisonList.objects.filter(session_key=session_key)
+    # Items, their products and the products' images in one query per table
+    comparison_lists = comparison_lists.prefetch_related(
+        Prefetch('items', queryset=ComparisonItem.objects.with_products())
+    )
     
     # For each comparison list, get all fields from the model
     for comparison_list in comparison_lists:
-        if comparison_list.items.exists():
-            first_item = comparison_list.items.first()
+        first_item = next(iter(comparison_list.items.all()), None)
+        if first_item is not None:
             model_class = first_item.content_type.model_class()
-            
-            # Get all fields from the model (excluding common fields)
-            exclude_fields = ['id', 'sku', 'name', 'brand', 'price', 'old_price', 
-                             'condition', 'description', 'top_pick', 'created_at', 
-                             'updated_at', 'images']
-            
-            model_fields = []
-            for field in model_class._meta.get_fields():
-                if hasattr(field, 'name') and field.name not in exclude_fields and not field.is_relation:
-                    model_fields.append({
-                        'name': field.name,
-                        'verbose_name': field.verbose_name.title() if hasattr(field, 'verbose_name') else field.name.replace('_', ' ').title(),
-                        'field_type': field.get_internal_type()
-                    })
-            
-            comparison_list.model_fields = model_fields
+            comparison_list.model_fields = compare_fields_for(model_class)
     
     context = {
         'comparison_lists': comparison_lists,
@@ -297,12 +365,12 @@ def comparison_view(request):
 
 def remove_from_comparison(request, item_id):
     """Remove an item from the comparison list"""
-    item = get_object_or_404(ComparisonItem, id=item_id)
+    item = get_object_or_404(ComparisonItem.objects.select_related('comparison_list'), id=item_id)
     comparison_list = item.comparison_list
     
     # Check if the user owns this comparison list
     if request.user.is_authenticated:
-        if comparison_list.user != request.user:
+        if comparison_list.user_id != request.user.pk:
             messages.error(request, "You don't have permission to remove this item.")
             return redirect('comparison_view')
     else:
@@ -312,12 +380,12 @@ def remove_from_comparison(request, item_id):
             return redirect('comparison_view')
     
     product_name = str(item.product)
-    item.delete()
+    with transaction.atomic():
+        item.delete()
+        # Delete the comparison list too if that was its last item
+        list_deleted, _ = ComparisonList.objects.filter(pk=comparison_list.pk, items__isnull=True).delete()
     
-    # Check if the comparison list is now empty
-    if comparison_list.items.count() == 0:
-        # Delete the empty comparison list
-        comparison_list.delete()
+    if list_deleted:
         messages.success(request, f"{product_name} removed and empty comparison list deleted.")
     else:
         messages.success(request, f"{product_name} removed from your comparison list.")
@@ -330,7 +398,7 @@ def clear_comparison(request, comparison_id):
     
     # Check if the user owns this comparison list
     if request.user.is_authenticated:
-        if comparison_list.user != request.user:
+        if comparison_list.user_id != request.user.pk:
             messages.error(request, "You don't have permission to clear this comparison list.")
             return redirect('comparison_view')
     else:
@@ -342,10 +410,7 @@ def clear_comparison(request, comparison_id):
     # Get the product type before deleting
     product_type = comparison_list.product_type
     
-    # Delete all items in the comparison list
-    comparison_list.items.all().delete()
-    
-    # Delete the empty comparison list
+    # Deleting the list cascades to its items in the same call
     comparison_list.delete()
     
     messages.success(request, f"{product_type.upper()} comparison list cleared and removed.")
@@ -378,7 +443,7 @@ def wishlist_view(request):
             wishlist_items = WishlistItem.objects.filter(session_key=session_key)
     
     context = {
-        'wishlist_items': wishlist_items,
+        'wishlist_items': wishlist_items.with_products(listing=True),
         'title': 'My Wishlist'
     }
     
@@ -386,74 +451,30 @@ def wishlist_view(request):
 
 def add_to_wishlist(request, product_sku):
     """Add a product to the wishlist using SKU"""
-    # Map model names to their classes
-    model_map = {
-        'gpu': GPU,
-        'cpu': CPU,
-        'ram': RAM,
-        'motherboard': Motherboard,
-        'case': Case,
-        'storagedevice': StorageDevice,
-        'psu': PSU,
-        'monitor': Monitor,
-        'tablet': Tablet,
-        'laptop': Laptop,
-    }
-    
-    # Try to find the product in any of the models by SKU
-    product = None
-    content_type = None
-    
-    for model_key, model_class in model_map.items():
-        try:
-            product = model_class.objects.get(sku=product_sku)
-            content_type = ContentType.objects.get_for_model(model_class)
-            break
-        except model_class.DoesNotExist:
-            continue
+    # Find the product by SKU with one query across the product tables
+    product, _ = find_product_by_sku(product_sku)
+    content_type = ContentType.objects.get_for_model(product) if product else None
     
     if not product:
         messages.error(request, f"Product with SKU {product_sku} not found.")
         return redirect('home')
     
-    # Add to wishlist
     if request.user.is_authenticated:
-        # Check if already in wishlist
-        if WishlistItem.objects.filter(
-            user=request.user,
-            content_type=content_type,
-            object_id=product.id
-        ).exists():
-            messages.info(request, f"{product} is already in your wishlist.")
-            return redirect('wishlist_view')
-            
-        # Add to wishlist
-        WishlistItem.objects.create(
-            user=request.user,
-            content_type=content_type,
-            object_id=product.id
-        )
+        owner = {'user': request.user}
     else:
         session_key = request.session.session_key
         if not session_key:
             request.session.create()
             session_key = request.session.session_key
-            
-        # Check if already in wishlist
-        if WishlistItem.objects.filter(
-            session_key=session_key,
-            content_type=content_type,
-            object_id=product.id
-        ).exists():
-            messages.info(request, f"{product} is already in your wishlist.")
-            return redirect('wishlist_view')
-            
-        # Add to wishlist
-        WishlistItem.objects.create(
-            session_key=session_key,
-            content_type=content_type,
-            object_id=product.id
-        )
+        owner = {'session_key': session_key}
+    
+    # Add to wishlist; the wish_unique_* constraints reject repeats
+    try:
+        with transaction.atomic():
+            WishlistItem.objects.create(**owner, content_type=content_type, object_id=product.id)
+    except IntegrityError:
+        messages.info(request, f"{product} is already in your wishlist.")
+        return redirect('wishlist_view')
     
     messages.success(request, f"{product} added to your wishlist.")
     return redirect('wishlist_view')
@@ -464,7 +485,7 @@ def remove_from_wishlist(request, item_id):
     
     # Check if the user owns this wishlist item
     if request.user.is_authenticated:
-        if item.user != request.user:
+        if item.user_id != request.user.pk:
             messages.error(request, "You don't have permission to remove this item.")
             return redirect('wishlist_view')
     else:
@@ -481,84 +502,49 @@ def remove_from_wishlist(request, item_id):
 
 def quick_view(request, product_sku):
     """AJAX view to display a quick preview of a product"""
-    # Map model names to their classes
-    model_map = {
-        'gpu': GPU,
-        'cpu': CPU,
-        'ram': RAM,
-        'motherboard': Motherboard,
-        'case': Case,
-        'storagedevice': StorageDevice,
-        'psu': PSU,
-        'monitor': Monitor,
-        'tablet': Tablet,
-        'laptop': Laptop,
-    }
-    
-    # Try to find the product in any of the models by SKU
-    product = None
-    model_name = None
-    
-    for model_key, model_class in model_map.items():
-        try:
-            product = model_class.objects.get(sku=product_sku)
-            model_name = model_key
-            break
-        except model_class.DoesNotExist:
-            continue
-    
-    if not product:
-        return JsonResponse({'error': f"Product with SKU {product_sku} not found."}, status=404)
-    
-    context = {
-        'product': product,
-        'model_name': model_name,
-    }
-    
-    return render(request, 'store/quick_view.html', context)
+    # The fragment is the same for every visitor, so repeat opens skip the database
+    key = catalog_cache_key('quick_view', product_sku)
+    html = cache.get(key)
+    if html is None:
+        # Find the product by SKU with one query across the product tables
+        product, model_name = find_product_by_sku(product_sku)
+        
+        if not product:
+            return JsonResponse({'error': f"Product with SKU {product_sku} not found."}, status=404)
+        
+        context = {
+            'product': product,
+            'model_name': model_name,
+        }
+        html = render_to_string('store/quick_view.html', context, request)
+        cache.set(key, html, 3600)
+    
+    return HttpResponse(html)
 
 def product_detail(request, product_sku):
     """
     Generic product detail view that works for all product types using only SKU
     """
-    # Map model names to their classes
-    model_map = {
-        'gpu': GPU,
-        'cpu': CPU,
-        'ram': RAM,
-        'motherboard': Motherboard,
-        'case': Case,
-        'storagedevice': StorageDevice,
-        'psu': PSU,
-        'monitor': Monitor,
-        'tablet': Tablet,
-        'laptop': Laptop,
-    }
-    
-    # Try to find the product in any of the models by SKU
-    product = None
-    product_type = None
-    model_class = None
-    
-    for model_key, model_class_temp in model_map.items():
-        try:
-            product = model_class_temp.objects.get(sku=product_sku)
-            product_type = model_key
-            model_class = model_class_temp
-            break
-        except model_class_temp.DoesNotExist:
-            continue
+    # Find the product by SKU with one query across the product tables
+    product, product_type = find_product_by_sku(product_sku)
     
     if not product:
         messages.error(request, f"Product with SKU {product_sku} not found.")
         return redirect('home')
+    model_class = type(product)
     
-    # Get related products (same type, same brand, excluding current product)
-    related_products = model_class.objects.filter(
+    # Get related products (same type, same brand, excluding current product);
+    # picked in Python so the database doesn't sort the whole brand by RANDOM()
+    candidates = list(model_class.objects.filter(
         brand=product.brand
     ).exclude(
         id=product.id
-    ).order_by('-top_pick', '?')[:4]  # Prioritize top picks, then random
+    ).values_list('id', 'top_pick'))
+    random.shuffle(candidates)
+    candidates.sort(key=itemgetter(1), reverse=True)  # Prioritize top picks, then random
+    picked = [pk for pk, _ in candidates[:4]]
+    related_by_id = model_class.objects.for_listing().select_related('primary_image').in_bulk(picked)
+    related_products = [related_by_id[pk] for pk in picked if pk in related_by_id]
     
     # Get specifications based on product fields
     specs = get_product_specs_from_fields(product)
@@ -573,6 +559,35 @@ def product_detail(request, product_sku):
     
     return render(request, 'store/product_detail.html', context)
 
+# Unit appended to numeric spec values; any *_clock field is in MHz
+SPEC_UNITS = {
+    'tdp': ' W',
+    'wattage': ' W',
+    'memory_size': ' GB',
+    'vram': ' GB',
+    'ram': ' GB',
+    'capacity': ' GB',
+    'screen_size': '"',
+    'refresh_rate': ' Hz',
+    'response_time': ' ms',
+}
+
+@lru_cache(maxsize=None)
+def spec_fields_for(model_class):
+    """(field name, display name, unit) rows get_product_specs_from_fields shows for model_class"""
+    # Skip these fields as they're either in common specs or not relevant for display
+    skip_fields = ['id', 'name', 'brand', 'sku', 'condition', 'price', 'old_price', 
+                  'top_pick', 'description', 'created_at', 'updated_at', 'images']
+    return tuple(
+        (
+            field.name,
+            field.name.replace('_', ' ').title(),
+            ' MHz' if field.name.endswith('_clock') else SPEC_UNITS.get(field.name),
+        )
+        for field in model_class._meta.get_fields()
+        if not field.is_relation and field.name not in skip_fields
+    )
+
 def get_product_specs_from_fields(product):
     """
     Get product specifications by inspecting model fields
@@ -580,14 +595,11 @@ def get_product_specs_from_fields(product):
     """
     specs = []
     
-    # Get model fields
-    fields = product._meta.get_fields()
-    
     # Common specifications (always shown first)
     common_specs = {
         'Brand': product.brand,
         'SKU': product.sku,
-        'Condition': product.condition.title() if hasattr(product, 'condition') else None,
+        'Condition': CONDITION_DISPLAY.get(product.condition, product.condition) if hasattr(product, 'condition') else None,
     }
     
     # Filter out None values
@@ -600,47 +612,26 @@ def get_product_specs_from_fields(product):
     # Technical specifications
     tech_specs = {}
     
-    # Skip these fields as they're either in common specs or not relevant for display
-    skip_fields = ['id', 'name', 'brand', 'sku', 'condition', 'price', 'old_price', 
-                  'top_pick', 'description', 'created_at', 'updated_at', 'images']
-    
     # Process each field
-    for field in fields:
-        # Skip relation fields and fields in skip_fields
-        if field.is_relation or field.name in skip_fields:
-            continue
-        
+    for field_name, display_name, unit in spec_fields_for(type(product)):
         # Get the value
-        value = getattr(product, field.name, None)
+        value = getattr(product, field_name, None)
         
         # Skip None values
         if value is None:
             continue
         
-        # Format field name for display
-        field_name = field.name.replace('_', ' ').title()
-        
         # Format value based on field type
         if isinstance(value, bool):
             formatted_value = "Yes" if value else "No"
-        elif field.name.endswith('_clock') and isinstance(value, (int, float)):
-            formatted_value = f"{value} MHz"
-        elif field.name == 'tdp' and isinstance(value, (int, float)):
-            formatted_value = f"{value} W"
-        elif field.name in ['memory_size', 'vram', 'ram', 'capacity'] and isinstance(value, (int, float)):
-            formatted_value = f"{value} GB"
-        elif field.name == 'screen_size' and isinstance(value, (int, float)):
-            formatted_value = f"{value}\""
-        elif field.name == 'refresh_rate' and isinstance(value, (int, float)):
-            formatted_value = f"{value} Hz"
-        elif field.name == 'response_time' and isinstance(value, (int, float)):
-            formatted_value = f"{value} ms"
-        elif field.name == 'wattage' and isinstance(value, (int, float)):
-            formatted_value = f"{value} W"
+        elif field_name == 'warranty':
+            formatted_value = WARRANTY_DISPLAY.get(value, value)
+        elif unit and isinstance(value, (int, float)):
+            formatted_value = f"{value}{unit}"
         else:
             formatted_value = str(value)
         
-        tech_specs[field_name] = formatted_value
+        tech_specs[display_name] = formatted_value
     
     # Add technical specs section if not empty
     if tech_specs:
@@ -648,6 +639,78 @@ def get_product_specs_from_fields(product):
     
     return specs
 
+# product_type -> (model, filters); each filter is
+# (GET parameter, lookup, cast or None for text, filter_options key)
+PRODUCT_TYPES = {
+    'gpu': (GPU, (
+        ('vram', 'vram', int, 'vram_options'),
+        ('memory_type', 'memory_type__iexact', None, 'memory_type_options'),
+    )),
+    'cpu': (CPU, (
+        ('cores', 'cores__gte', int, 'cores_options'),
+        ('threads', 'threads__gte', int, 'threads_options'),
+    )),
+    'ram': (RAM, (
+        ('ram_type', 'ram_type__iexact', None, 'ram_type_options'),
+        ('capacity', 'capacity__gte', int, 'capacity_options'),
+        ('form_factor', 'form_factor__iexact', None, 'form_factor_options'),
+    )),
+    'motherboard': (Motherboard, (
+        ('form_factor', 'form_factor__iexact', None, 'form_factor_options'),
+        ('ram_type', 'ram_type__iexact', None, 'ram_type_options'),
+        ('ram_slots', 'ram_slots__gte', int, 'ram_slots_options'),
+    )),
+    'case': (Case, (
+        ('case_type', 'case_type__iexact', None, 'case_type_options'),
+    )),
+    'storage': (StorageDevice, (
+        ('storage_type', 'storage_type__iexact', None, 'storage_type_options'),
+        ('form_factor', 'form_factor__iexact', None, 'form_factor_options'),
+    )),
+    'psu': (PSU, (
+        ('form_factor', 'form_factor__iexact', None, 'form_factor_options'),
+        ('wattage', 'wattage__gte', int, 'wattage_options'),
+    )),
+    'monitor': (Monitor, (
+        ('resolution', 'resolution__iexact', None, 'resolution_options'),
+        ('screen_size', 'screen_size', float, 'screen_size_options'),
+    )),
+    'tablet': (Tablet, (
+        ('storage', 'storage__gte', int, 'storage_options'),
+        ('screen_size', 'screen_size', float, 'screen_size_options'),
+    )),
+    'laptop': (Laptop, (
+        ('min_ram', 'ram_capacity__gte', int, 'ram_options'),
+        ('screen_size', 'screen_size', float, 'screen_size_options'),
+    )),
+    'mouse': (Mouse, (
+        ('dpi', 'dpi__gte', int, 'dpi_options'),
+        ('connection_type', 'connection_type__iexact', None, 'connection_type_options'),
+        ('buttons', 'buttons__gte', int, 'buttons_options'),
+    )),
+    'keyboard': (Keyboard, (
+        ('connection_type', 'connection_type__iexact', None, 'connection_type_options'),
+        ('keyboard_type', 'keyboard_type__iexact', None, 'keyboard_type_options'),
+    )),
+    'headset': (Headset, ()),
+    'speakers': (Speakers, (
+        ('connection_type', 'connection_type__iexact', None, 'connection_type_options'),
+    )),
+}
+
+def product_filter_options(product_type):
+    """Brands and per-filter dropdown values for a PRODUCT_TYPES entry"""
+    model_class, filters = PRODUCT_TYPES[product_type]
+    fields = ['brand', *(lookup.split('__')[0] for param, lookup, cast, options_key in filters)]
+    # One scan over the distinct combinations, then split back into sorted per-column options
+    columns = zip(*model_class.objects.values_list(*fields).distinct())
+    brands, *options = [sorted(set(values)) for values in columns] or [[] for field in fields]
+    filter_options = {
+        options_key: values
+        for (param, lookup, cast, options_key), values in zip(filters, options)
+    }
+    return brands, filter_options
+
 def product_list(request, product_type=None):
     """
     Generic product listing view with filtering capabilities
@@ -655,33 +718,15 @@ def product_list(request, product_type=None):
     # Convert product_type to lowercase for case-insensitive matching
     product_type = product_type.lower() if product_type else None
     
-    # Map model names to their classes
-    model_map = {
-        'gpu': GPU,
-        'cpu': CPU,
-        'ram': RAM,
-        'motherboard': Motherboard,
-        'case': Case,
-        'storage': StorageDevice,
-        'psu': PSU,
-        'monitor': Monitor,
-        'tablet': Tablet,
-        'laptop': Laptop,
-        'mouse': Mouse,
-        'keyboard': Keyboard,
-        'headset': Headset,
-        'speakers': Speakers,
-    }
-    
     # Get the model class based on product_type
-    if product_type not in model_map:
+    if product_type not in PRODUCT_TYPES:
         messages.error(request, f"Invalid product type: {product_type}")
         return redirect('home')
     
-    model_class = model_map[product_type]
+    model_class, filters = PRODUCT_TYPES[product_type]
     
     # Start with all products of the given type
-    products = model_class.objects.all()
+    products = model_class.objects.for_listing().select_related('primary_image').with_images()
     
     # Get common filter parameters from request
     brand = request.GET.get('brand')
@@ -693,245 +738,26 @@ def product_list(request, product_type=None):
         products = products.filter(brand__iexact=brand)
     
     if condition:
-        products = products.filter(condition__iexact=condition)
+        # Condition codes are stored lowercase, so equality keeps the condition indexes usable
+        products = products.filter(condition=condition.lower())
     
     # Apply product-specific filters
-    filter_options = {}
-    model_fields = [field.name for field in model_class._meta.get_fields()]
-    
-    if product_type == 'gpu':
-        if 'vram' in model_fields:
-            vram = request.GET.get('vram')
-            if vram:
-                try:
-                    products = products.filter(vram=int(vram))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['vram_options'] = model_class.objects.values_list('vram', flat=True).distinct()
-        if 'memory_type' in model_fields:
-            memory_type = request.GET.get('memory_type')
-            if memory_type:
-                products = products.filter(memory_type__iexact=memory_type)
-            filter_options['memory_type_options'] = model_class.objects.values_list('memory_type', flat=True).distinct()
-    
-    elif product_type == 'cpu':
-        if 'generation' in model_fields:
-            generation = request.GET.get('generation')
-            if generation:
-                products = products.filter(generation__icontains=generation)
-            filter_options['generation_options'] = model_class.objects.values_list('generation', flat=True).distinct()
-        if 'cores' in model_fields:
-            cores = request.GET.get('cores')
-            if cores:
-                try:
-                    products = products.filter(cores__gte=int(cores))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['cores_options'] = sorted(model_class.objects.values_list('cores', flat=True).distinct())
-        if 'threads' in model_fields:
-            threads = request.GET.get('threads')
-            if threads:
-                try:
-                    products = products.filter(threads__gte=int(threads))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['threads_options'] = sorted(model_class.objects.values_list('threads', flat=True).distinct())
-    
-    elif product_type == 'ram':
-        if 'ram_type' in model_fields:
-            ram_type = request.GET.get('ram_type')
-            if ram_type:
-                products = products.filter(ram_type__iexact=ram_type)
-            filter_options['ram_type_options'] = model_class.objects.values_list('ram_type', flat=True).distinct()
-        if 'capacity' in model_fields:
-            capacity = request.GET.get('capacity')
-            if capacity:
-                try:
-                    products = products.filter(capacity__gte=int(capacity))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['capacity_options'] = sorted(model_class.objects.values_list('capacity', flat=True).distinct())
-        if 'form_factor' in model_fields:
-            form_factor = request.GET.get('form_factor')
-            if form_factor:
-                products = products.filter(form_factor__iexact=form_factor)
-            filter_options['form_factor_options'] = model_class.objects.values_list('form_factor', flat=True).distinct()
-    
-    elif product_type == 'laptop':
-        if 'ram_capacity' in model_fields:
-            min_ram = request.GET.get('min_ram')
-            if min_ram:
-                try:
-                    products = products.filter(ram_capacity__gte=int(min_ram))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['ram_options'] = sorted(model_class.objects.values_list('ram_capacity', flat=True).distinct())
-        if 'screen_size' in model_fields:
-            screen_size = request.GET.get('screen_size')
-            if screen_size:
-                try:
-                    products = products.filter(screen_size=float(screen_size))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['screen_size_options'] = sorted(model_class.objects.values_list('screen_size', flat=True).distinct())
-    
-    elif product_type == 'tablet':
-        if 'ram_capacity' in model_fields:
-            min_ram = request.GET.get('min_ram')
-            if min_ram:
-                try:
-                    products = products.filter(ram_capacity__gte=int(min_ram))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['ram_options'] = sorted(model_class.objects.values_list('ram_capacity', flat=True).distinct())
-        if 'storage' in model_fields:
-            storage = request.GET.get('storage')
-            if storage:
-                try:
-                    products = products.filter(storage__gte=int(storage))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['storage_options'] = sorted(model_class.objects.values_list('storage', flat=True).distinct())
-        if 'screen_size' in model_fields:
-            screen_size = request.GET.get('screen_size')
-            if screen_size:
-                try:
-                    products = products.filter(screen_size=float(screen_size))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['screen_size_options'] = sorted(model_class.objects.values_list('screen_size', flat=True).distinct())
-    
-    elif product_type == 'storage':
-        if 'storage_type' in model_fields:
-            storage_type = request.GET.get('storage_type')
-            if storage_type:
-                products = products.filter(storage_type__iexact=storage_type)
-            filter_options['storage_type_options'] = model_class.objects.values_list('storage_type', flat=True).distinct()
-        if 'form_factor' in model_fields:
-            form_factor = request.GET.get('form_factor')
-            if form_factor:
-                products = products.filter(form_factor__iexact=form_factor)
-            filter_options['form_factor_options'] = model_class.objects.values_list('form_factor', flat=True).distinct()
-    
-    elif product_type == 'psu':
-        if 'form_factor' in model_fields:
-            form_factor = request.GET.get('form_factor')
-            if form_factor:
-                products = products.filter(form_factor__iexact=form_factor)
-            filter_options['form_factor_options'] = model_class.objects.values_list('form_factor', flat=True).distinct()
-        if 'wattage' in model_fields:
-            wattage = request.GET.get('wattage')
-            if wattage:
-                try:
-                    products = products.filter(wattage__gte=int(wattage))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['wattage_options'] = sorted(model_class.objects.values_list('wattage', flat=True).distinct())
-    
-    elif product_type == 'case':
-        if 'case_type' in model_fields:
-            case_type = request.GET.get('case_type')
-            if case_type:
-                products = products.filter(case_type__iexact=case_type)
-            filter_options['case_type_options'] = model_class.objects.values_list('case_type', flat=True).distinct()
-    
-    elif product_type == 'monitor':
-        if 'resolution' in model_fields:
-            resolution = request.GET.get('resolution')
-            if resolution:
-                products = products.filter(resolution__iexact=resolution)
-            filter_options['resolution_options'] = model_class.objects.values_list('resolution', flat=True).distinct()
-        if 'screen_size' in model_fields:
-            screen_size = request.GET.get('screen_size')
-            if screen_size:
-                try:
-                    products = products.filter(screen_size=float(screen_size))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['screen_size_options'] = sorted(model_class.objects.values_list('screen_size', flat=True).distinct())
-    
-    elif product_type == 'keyboard':
-        if 'connection_type' in model_fields:
-            connection_type = request.GET.get('connection_type')
-            if connection_type:
-                products = products.filter(connection_type__iexact=connection_type)
-            filter_options['connection_type_options'] = model_class.objects.values_list('connection_type', flat=True).distinct()
-        if 'keyboard_type' in model_fields:
-            keyboard_type = request.GET.get('keyboard_type')
-            if keyboard_type:
-                products = products.filter(keyboard_type__iexact=keyboard_type)
-            filter_options['keyboard_type_options'] = model_class.objects.values_list('keyboard_type', flat=True).distinct()
-    
-    elif product_type == 'mouse':
-        if 'dpi' in model_fields:
-            dpi = request.GET.get('dpi')
-            if dpi:
-                try:
-                    products = products.filter(dpi__gte=int(dpi))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['dpi_options'] = sorted(model_class.objects.values_list('dpi', flat=True).distinct())
-        if 'connection_type' in model_fields:
-            connection_type = request.GET.get('connection_type')
-            if connection_type:
-                products = products.filter(connection_type__iexact=connection_type)
-            filter_options['connection_type_options'] = model_class.objects.values_list('connection_type', flat=True).distinct()
-        if 'buttons' in model_fields:
-            buttons = request.GET.get('buttons')
-            if buttons:
-                try:
-                    products = products.filter(buttons__gte=int(buttons))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['buttons_options'] = sorted(model_class.objects.values_list('buttons', flat=True).distinct())
-    
-    elif product_type == 'motherboard':
-        if 'form_factor' in model_fields:
-            form_factor = request.GET.get('form_factor')
-            if form_factor:
-                products = products.filter(form_factor__iexact=form_factor)
-            filter_options['form_factor_options'] = model_class.objects.values_list('form_factor', flat=True).distinct()
-        if 'ram_type' in model_fields:
-            ram_type = request.GET.get('ram_type')
-            if ram_type:
-                products = products.filter(ram_type__iexact=ram_type)
-            filter_options['ram_type_options'] = model_class.objects.values_list('ram_type', flat=True).distinct()
-        if 'ram_slots' in model_fields:
-            ram_slots = request.GET.get('ram_slots')
-            if ram_slots:
-                try:
-                    products = products.filter(ram_slots__gte=int(ram_slots))
-                except (ValueError, TypeError):
-                    pass
-            filter_options['ram_slots_options'] = sorted(model_class.objects.values_list('ram_slots', flat=True).distinct())
-    
-    elif product_type == 'speakers':
-        if 'connection_type' in model_fields:
-            connection_type = request.GET.get('connection_type')
-            if connection_type:
-                products = products.filter(connection_type__iexact=connection_type)
-            filter_options['connection_type_options'] = model_class.objects.values_list('connection_type', flat=True).distinct()
-    
-    # Apply sorting
-    # Convert queryset to list for case-insensitive sorting like in all_products view
-    products_list = list(products)
-    
-    if sort_by == 'price_low':
-        products_list.sort(key=lambda x: x.price if x.price else float('inf'))
-    elif sort_by == 'price_high':
-        products_list.sort(key=lambda x: x.price if x.price else float('-inf'), reverse=True)
-    elif sort_by == 'name_asc':
-        products_list.sort(key=lambda x: x.name.lower())
-    elif sort_by == 'name_desc':
-        products_list.sort(key=lambda x: x.name.lower(), reverse=True)
-    else:  # newest
-        products_list.sort(key=lambda x: x.id, reverse=True)
-    
-    # Convert back to queryset-like object for template compatibility
-    products = products_list
-    
-    # Get unique brands for filter dropdown
-    all_brands = model_class.objects.values_list('brand', flat=True).distinct()
+    for param, lookup, cast, options_key in filters:
+        value = request.GET.get(param)
+        if value:
+            try:
+                products = products.filter(**{lookup: cast(value) if cast else value})
+            except (ValueError, TypeError):
+                pass
+    all_brands, filter_options = cache.get_or_set(
+        catalog_cache_key('product_options', product_type),
+        lambda: product_filter_options(product_type),
+        3600,
+    )
+    
+    # Apply sorting and take one page; names sort case-insensitively like in all_products view
+    cursor = request.GET.get('cursor')
+    products, next_cursor = keyset_page(products, sort_by, cursor)
     
     # Update context to include counts for all categories
     context = {
@@ -942,23 +768,10 @@ def product_list(request, product_type=None):
         'current_brand': brand,
         'current_condition': condition,
         'current_sort': sort_by,
+        'current_cursor': cursor,
+        'next_cursor': next_cursor,
         'filter_options': filter_options,
         'title': f'{product_type.replace("_", " ").title()}s - Browse All',
-        'cpu_count': CPU.objects.count(),
-        'gpu_count': GPU.objects.count(),
-        'ram_count': RAM.objects.count(),
-        'storage_count': StorageDevice.objects.count(),
-        'motherboard_count': Motherboard.objects.count(),
-        'case_count': Case.objects.count(),
-        'psu_count': PSU.objects.count(),
-        'monitor_count': Monitor.objects.count(),
-        'tablet_count': Tablet.objects.count(),
-        'laptop_count': Laptop.objects.count(),
-        'mouse_count': Mouse.objects.count(),
-        'keyboard_count': Keyboard.objects.count(),
-        'headset_count': Headset.objects.count(),
-        'speakers_count': Speakers.objects.count(),
-        'other_accessory_count': OtherAccessory.objects.count(),
     }
     
     return render(request, 'store/product_list.html', context)
@@ -989,12 +802,16 @@ def all_products(request):
         'OTHER_ACCESSORY': OtherAccessory,  # Added
     }
     
-    results = []
-    for model_name, model in model_map.items():
-        # Skip if category filter is active and doesn't match
-        if category and category.upper() != model_name:
-            continue
-            
+    # A category filter goes straight to its one model
+    if category:
+        model_name = category.upper()
+        selected = [(model_name, model_map[model_name])] if model_name in model_map else []
+    else:
+        selected = list(model_map.items())
+    key, descending = LISTING_SORTS.get(sort_by, (F('id'), True))
+    
+    arms = []
+    for index, (model_name, model) in enumerate(selected):
         queryset = model.objects.all()
         
         # Apply search filter if query exists
@@ -1010,47 +827,52 @@ def all_products(request):
         if condition:
             queryset = queryset.filter(condition=condition)
         
-        for product in queryset:
-            results.append({
-                'type': model_name,
-                'product': product
-            })
-    
-    # Apply sorting
-    if sort_by == 'price_low':
-        results.sort(key=lambda x: x['product'].price if x['product'].price else float('inf'))
-    elif sort_by == 'price_high':
-        results.sort(key=lambda x: x['product'].price if x['product'].price else float('-inf'), reverse=True)
-    elif sort_by == 'name_asc':
-        results.sort(key=lambda x: x['product'].name.lower())
-    elif sort_by == 'name_desc':
-        results.sort(key=lambda x: x['product'].name.lower(), reverse=True)
-    else:  # newest
-        results.sort(key=lambda x: x['product'].id, reverse=True)
+        arms.append(queryset.annotate(sort_key=key, model_index=Value(index)).values_list(
+            *LISTING_COLUMNS, 'sort_key', 'model_index'
+        ))
+    
+    # Sort and page every matching product in one UNION ALL; ties keep model_map order
+    if arms:
+        sort_key = F('sort_key')
+        combined = arms[0].union(*arms[1:], all=True).order_by(
+            sort_key.desc(nulls_last=True) if descending else sort_key.asc(nulls_last=True), 'model_index', 'id'
+        )
+    else:
+        combined = []
+    page_obj = Paginator(combined, PAGE_SIZE).get_page(request.GET.get('page'))
+    rows = list(page_obj)
+    products = listing_instances([model for model_name, model in selected], rows)
+    ProductImage.prefetch_for(products)
+    results = [
+        {'type': selected[row[-1]][0], 'product': product}
+        for row, product in zip(rows, products)
+    ]
     
     # Update categories list to include all categories with counts
+    counts = cached_category_counts()
     categories = [
-        {'code': 'GPU', 'name': 'Graphics Cards', 'count': GPU.objects.count()},
-        {'code': 'CPU', 'name': 'Processors', 'count': CPU.objects.count()},
-        {'code': 'RAM', 'name': 'Memory', 'count': RAM.objects.count()},
-        {'code': 'MOTHERBOARD', 'name': 'Motherboards', 'count': Motherboard.objects.count()},
-        {'code': 'CASE', 'name': 'Cases', 'count': Case.objects.count()},
-        {'code': 'STORAGE', 'name': 'Storage', 'count': StorageDevice.objects.count()},
-        {'code': 'PSU', 'name': 'Power Supplies', 'count': PSU.objects.count()},
-        {'code': 'MONITOR', 'name': 'Monitors', 'count': Monitor.objects.count()},
-        {'code': 'TABLET', 'name': 'Tablets', 'count': Tablet.objects.count()},
-        {'code': 'LAPTOP', 'name': 'Laptops', 'count': Laptop.objects.count()},
-        {'code': 'MOUSE', 'name': 'Mice', 'count': Mouse.objects.count()},  # Added
-        {'code': 'KEYBOARD', 'name': 'Keyboards', 'count': Keyboard.objects.count()},  # Added
-        {'code': 'HEADSET', 'name': 'Headsets', 'count': Headset.objects.count()},  # Added
-        {'code': 'SPEAKERS', 'name': 'Speakers', 'count': Speakers.objects.count()},  # Added
-        {'code': 'OTHER_ACCESSORY', 'name': 'Other Accessories', 'count': OtherAccessory.objects.count()},  # Added
+        {'code': 'GPU', 'name': 'Graphics Cards', 'count': counts['gpu_count']},
+        {'code': 'CPU', 'name': 'Processors', 'count': counts['cpu_count']},
+        {'code': 'RAM', 'name': 'Memory', 'count': counts['ram_count']},
+        {'code': 'MOTHERBOARD', 'name': 'Motherboards', 'count': counts['motherboard_count']},
+        {'code': 'CASE', 'name': 'Cases', 'count': counts['case_count']},
+        {'code': 'STORAGE', 'name': 'Storage', 'count': counts['storage_count']},
+        {'code': 'PSU', 'name': 'Power Supplies', 'count': counts['psu_count']},
+        {'code': 'MONITOR', 'name': 'Monitors', 'count': counts['monitor_count']},
+        {'code': 'TABLET', 'name': 'Tablets', 'count': counts['tablet_count']},
+        {'code': 'LAPTOP', 'name': 'Laptops', 'count': counts['laptop_count']},
+        {'code': 'MOUSE', 'name': 'Mice', 'count': counts['mouse_count']},  # Added
+        {'code': 'KEYBOARD', 'name': 'Keyboards', 'count': counts['keyboard_count']},  # Added
+        {'code': 'HEADSET', 'name': 'Headsets', 'count': counts['headset_count']},  # Added
+        {'code': 'SPEAKERS', 'name': 'Speakers', 'count': counts['speakers_count']},  # Added
+        {'code': 'OTHER_ACCESSORY', 'name': 'Other Accessories', 'count': counts['other_accessory_count']},  # Added
     ]
     
     context = {
         'query': query,
         'products': results,
-        'total_count': len(results),
+        'page_obj': page_obj,
+        'total_count': page_obj.paginator.count,
         'current_sort': sort_by,
         'current_condition': condition,
         'current_category': category,
@@ -1072,23 +894,8 @@ def all_categories(request):
     """
     View to display all product categories
     """
-    # Get counts for each category
+    # Counts come from the category_counts context processor
     context = {
-        'gpu_count': GPU.objects.count(),
-        'cpu_count': CPU.objects.count(),
-        'ram_count': RAM.objects.count(),
-        'motherboard_count': Motherboard.objects.count(),
-        'case_count': Case.objects.count(),
-        'storage_count': StorageDevice.objects.count(),
-        'psu_count': PSU.objects.count(),
-        'monitor_count': Monitor.objects.count(),
-        'tablet_count': Tablet.objects.count(),
-        'laptop_count': Laptop.objects.count(),
-        'mouse_count': Mouse.objects.count(),
-        'keyboard_count': Keyboard.objects.count(),
-        'headset_count': Headset.objects.count(),
-        'speakers_count': Speakers.objects.count(),
-        'other_accessory_count': OtherAccessory.objects.count(),
         'title': 'All Categories'
     }
     
@@ -1098,11 +905,18 @@ def subscribe_newsletter(request):
     if request.method == 'POST':
         form = SubscriberForm(request.POST)
         if form.is_valid():
-            form.save()
-            response_data = {
-                'success': True,
-                'message': 'Thank you for subscribing to our newsletter!'
-            }
+            try:
+                form.save()
+                response_data = {
+                    'success': True,
+                    'message': 'Thank you for subscribing to our newsletter!'
+                }
+            except IntegrityError:
+                # Another request subscribed the same address after validation
+                response_data = {
+                    'success': False,
+                    'message': SubscriberForm._meta.error_messages['email']['unique']
+                }
         else:
             response_data = {
                 'success': False,